@@ -3,21 +3,33 @@ Thermal Viewer Backend API
 Flask server providing REST endpoints for thermal mosaic viewer
 """
 
-from flask import Flask, jsonify, request, send_file
+from flask import Flask, Response, after_this_request, g, jsonify, request, send_file
 from flask_cors import CORS
+from flask_caching import Cache
 import boto3
+import orjson
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from botocore.config import Config
 from botocore.exceptions import ClientError
 import os
-import io
 import logging
+import tempfile
+from urllib.parse import urlencode
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
+from collections.abc import Iterator
 from decimal import Decimal
 
 from services.mosaic_service import MosaicService
 from services.camera_service import CameraService
-from services.image_service import ImageService
+from services.image_service import ImageService, reset_request_item_cache
 from services.pipemeasure_service import PipeMeasureService
 from services.report_service import ReportService
-from middleware.auth import require_auth, init_auth
+from services.s3_presigner import S3Presigner
+from services.pad_image_query import is_missing_index_error
+from services.colorbar_bloom import load_colorbar_bloom
+from services.cloudfront_signer import make_cloudfront_signer
+from middleware.auth import require_admin, require_auth, init_auth
 
 # Setup logging
 logging.basicConfig(
@@ -38,67 +50,321 @@ JOBS_TABLE = os.environ.get('JOBS_TABLE', 'thermal-api-dev-jobs-7ecb7171')
 PADS_TABLE = os.environ.get('PADS_TABLE', 'thermal-api-dev-pads-7ecb7171')
 MEASUREMENTS_TABLE = os.environ.get('MEASUREMENTS_TABLE', 'thermal-api-dev-measurements-7ecb7171')
 
-# Initialize AWS clients
-s3_client = boto3.client('s3', region_name=AWS_REGION)
-dynamodb = boto3.resource('dynamodb', region_name=AWS_REGION)
+# Discovery responses change on the order of hours; cache them per query string.
+# Use CACHE_TYPE=RedisCache (with CACHE_REDIS_URL) to share the cache across workers.
+DISCOVERY_CACHE_TTL = int(os.environ.get('DISCOVERY_CACHE_TTL', 300))
+cache = Cache(app, config={
+    'CACHE_TYPE': os.environ.get('CACHE_TYPE', 'SimpleCache'),
+    'CACHE_REDIS_URL': os.environ.get('CACHE_REDIS_URL'),
+    'CACHE_DEFAULT_TIMEOUT': DISCOVERY_CACHE_TTL
+})
+
+# Sparse GSI on the pads table: PK entity_type ('pad'), SK site_sector ("{site}_{sector}")
+ALL_PADS_INDEX = 'AllPadsIndex'
+
+# Initialize AWS clients. The default pool of 10 connections would throttle the
+# scan/presign/completeness thread pools, so size it above their combined width.
+boto_config = Config(
+    max_pool_connections=64,
+    retries={'mode': 'adaptive', 'max_attempts': 6},
+    tcp_keepalive=True
+)
+# One shared S3 client for every service. Presigned URLs use SigV4 (SigV2 is
+# deprecated and unsupported in newer regions). The client and S3Presigner sign
+# with the same credentials object from this session.
+_s3_session = boto3.Session()
+s3_client = _s3_session.client(
+    's3',
+    region_name=AWS_REGION,
+    config=boto_config.merge(Config(signature_version='s3v4'))
+)
+dynamodb = boto3.resource('dynamodb', region_name=AWS_REGION, config=boto_config)
+# Low-level client (thread-safe) for the paginated discovery queries and scans
+dynamodb_client = boto3.client('dynamodb', region_name=AWS_REGION, config=boto_config)
+_serializer = TypeSerializer()
+_deserializer = TypeDeserializer()
 images_table = dynamodb.Table(IMAGES_TABLE)
 jobs_table = dynamodb.Table(JOBS_TABLE)
 pads_table = dynamodb.Table(PADS_TABLE)
 measurements_table = dynamodb.Table(MEASUREMENTS_TABLE)
 
+# Optional DynamoDB Accelerator (DAX) cluster for the read-only mosaic and
+# PipeMeasure paths. Those records are written once per processing job, so
+# DAX's TTL-based item/query caches serve them without invalidation.
+DAX_ENDPOINT = os.environ.get('DAX_ENDPOINT')
+mosaic_dynamodb_client = dynamodb_client
+pipemeasure_table = measurements_table
+if DAX_ENDPOINT:
+    try:
+        from amazondax import AmazonDaxClient
+        dax_client = AmazonDaxClient(endpoint_url=DAX_ENDPOINT, region_name=AWS_REGION)
+        dax_resource = AmazonDaxClient.resource(endpoint_url=DAX_ENDPOINT, region_name=AWS_REGION)
+        mosaic_dynamodb_client = dax_client
+        pipemeasure_table = dax_resource.Table(MEASUREMENTS_TABLE)
+        logger.info(f"Mosaic and PipeMeasure reads via DAX at {DAX_ENDPOINT}")
+    except Exception as e:
+        logger.error(f"DAX unavailable ({e}); reading DynamoDB directly")
+
+# Segmented scans for discovery endpoints run on a shared worker pool
+SCAN_SEGMENTS = 8
+_scan_executor = ThreadPoolExecutor(max_workers=SCAN_SEGMENTS, thread_name_prefix='ddb-scan')
+
+# Pad completeness checks for /api/pads run on their own pool
+_completeness_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix='pad-check')
+
+# Batch presigning for /api/images/urls; no point exceeding the S3 connection pool
+MAX_BATCH_IMAGE_IDS = 500
+_presign_executor = ThreadPoolExecutor(
+    max_workers=s3_client.meta.config.max_pool_connections,
+    thread_name_prefix='presign'
+)
+
+# Presigned GETs on the hot paths skip botocore's per-call request pipeline.
+# The bucket must live in AWS_REGION (as it must for s3_client already).
+_s3_credentials = _s3_session.get_credentials()
+s3_presigner = (
+    S3Presigner(_s3_credentials, S3_BUCKET, AWS_REGION)
+    if _s3_credentials and S3Presigner.supports(S3_BUCKET)
+    else None
+)
+
+# Optional Bloom filter of existing colorbars (scripts/build_colorbar_bloom.py),
+# checked for a rebuild every COLORBAR_BLOOM_RELOAD_SECONDS
+COLORBAR_BLOOM_KEY = os.environ.get('COLORBAR_BLOOM_KEY')
+COLORBAR_BLOOM_RELOAD_SECONDS = int(os.environ.get('COLORBAR_BLOOM_RELOAD_SECONDS', 3600))
+colorbar_bloom = (
+    load_colorbar_bloom(s3_client, S3_BUCKET, COLORBAR_BLOOM_KEY, COLORBAR_BLOOM_RELOAD_SECONDS)
+    if COLORBAR_BLOOM_KEY else None
+)
+
+# Optional CloudFront distribution for orthomosaics (signed URLs, edge cached)
+CLOUDFRONT_DOMAIN = os.environ.get('CLOUDFRONT_DOMAIN')
+cloudfront_signer = None
+if CLOUDFRONT_DOMAIN:
+    try:
+        with open(os.environ['CLOUDFRONT_PRIVATE_KEY_PATH'], 'rb') as key_file:
+            cloudfront_signer = make_cloudfront_signer(os.environ['CLOUDFRONT_KEY_ID'], key_file.read())
+        logger.info(f"Orthomosaic URLs signed for CloudFront at {CLOUDFRONT_DOMAIN}")
+    except Exception as e:
+        logger.error(f"CloudFront signing unavailable ({e}); presigning orthomosaics with S3")
+
+# Read pads by key from the images SiteSectorPeriodPadIndex. Enable only after
+# scripts/backfill_sector_period_pad.py has run and ingest writes sector_period_pad;
+# until then pads are read from SiteSectorPeriodIndex with a pad_id filter.
+USE_PAD_INDEX = os.environ.get('USE_PAD_INDEX', '').lower() == 'true'
+
 # Initialize services
-mosaic_service = MosaicService(s3_client, S3_BUCKET, images_table, jobs_table)
-camera_service = CameraService(s3_client, S3_BUCKET, images_table)
-image_service = ImageService(s3_client, S3_BUCKET, images_table)
-pipemeasure_service = PipeMeasureService(measurements_table)
+mosaic_service = MosaicService(
+    s3_client, S3_BUCKET, images_table, jobs_table, mosaic_dynamodb_client,
+    presigner=s3_presigner,
+    cloudfront_domain=CLOUDFRONT_DOMAIN,
+    cloudfront_signer=cloudfront_signer,
+    credentials=_s3_credentials,
+    use_pad_index=USE_PAD_INDEX
+)
+camera_service = CameraService(s3_client, S3_BUCKET, images_table, dynamodb_client, use_pad_index=USE_PAD_INDEX)
+image_service = ImageService(
+    s3_client, S3_BUCKET, images_table, dynamodb_client,
+    colorbar_base_url=os.environ.get('COLORBAR_BASE_URL'),
+    presigner=s3_presigner,
+    colorbar_bloom=colorbar_bloom,
+    credentials=_s3_credentials
+)
+pipemeasure_service = PipeMeasureService(pipemeasure_table)
 report_service = ReportService(
-    template_path=os.path.join(os.path.dirname(__file__), 'templates', 'line-loss-template.docx')
+    template_path=os.path.join(os.path.dirname(__file__), 'templates', 'line-loss-template.docx'),
+    unoserver_host=os.environ.get('UNOSERVER_HOST'),
+    unoserver_port=int(os.environ.get('UNOSERVER_PORT', 2003)),
+    renderer=os.environ.get('REPORT_RENDERER', 'docx')
 )
 
 # Initialize authentication
 init_auth(app)
 
 
-# Helper function to convert Decimal to float for JSON serialization
+@app.before_request
+def _reset_request_caches():
+    """Give each request its own image record memo (worker threads are reused)"""
+    reset_request_item_cache()
+
+
+# Helper function to convert Decimal to float for JSON serialization.
+# Walks the tree with an explicit stack and converts in place (no copy of the
+# containers), so callers must not rely on the original Decimal values afterwards.
 def decimal_to_float(obj):
     if isinstance(obj, Decimal):
         return float(obj)
-    elif isinstance(obj, dict):
-        return {k: decimal_to_float(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [decimal_to_float(item) for item in obj]
+
+    stack = deque([obj])
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            entries = node.items()
+        elif isinstance(node, list):
+            entries = enumerate(node)
+        else:
+            continue
+
+        for key, value in entries:
+            if isinstance(value, Decimal):
+                node[key] = float(value)
+            elif isinstance(value, (dict, list)):
+                stack.append(value)
     return obj
 
 
+def _orjson_default(obj):
+    """orjson fallback for types it can't serialize natively (e.g. DynamoDB Decimals)"""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _stream_feature_collection(members):
+    """
+    Serialize GeoJSON members one at a time, streaming the features array.
+
+    Members are (name, value) pairs; an iterator value (the features) is
+    written one feature at a time. Headers (and the 200 status) are already
+    sent when the features are consumed, so an error mid-stream is logged and
+    the open array and object are closed where they stand: the body stays
+    valid JSON with the same members, just fewer features.
+    """
+    closing = b'}'
+    yield b'{'
+    try:
+        for i, (name, value) in enumerate(members):
+            prefix = (b',' if i else b'') + orjson.dumps(name) + b':'
+            if not isinstance(value, Iterator):
+                yield prefix + orjson.dumps(value, default=_orjson_default)
+                continue
+
+            closing = b']}'
+            yield prefix + b'['
+            for j, feature in enumerate(value):
+                yield (b',' if j else b'') + orjson.dumps(feature, default=_orjson_default)
+            yield b']'
+            closing = b'}'
+    except Exception as e:
+        logger.error(f"Camera positions truncated: {e}")
+    yield closing
+
+
+def _is_success(rv):
+    """Cache filter: only cache successful view responses, never errors"""
+    status = rv[1] if isinstance(rv, tuple) else rv.status_code
+    return status == 200
+
+
+def _pads_cache_key(site, sector, period):
+    """Cache key of the /api/pads response for these query values"""
+    return 'view/api/pads?' + urlencode({'site': site or '', 'sector': sector or '', 'period': period or ''})
+
+
+def _pads_request_cache_key():
+    """Cache key of the current /api/pads request (see _pads_cache_key)"""
+    return _pads_cache_key(request.args.get('site'), request.args.get('sector'), request.args.get('period'))
+
+
+def _is_complete_pads_list(rv):
+    """Cache filter for /api/pads: successful and no pad's completeness unknown"""
+    return _is_success(rv) and not g.get('pads_completeness_unknown')
+
+
+def _paginate_items(operation, table_name, **kwargs):
+    """
+    Iterate over every item of a low-level DynamoDB query or scan.
+
+    Uses the botocore paginator (which carries ExclusiveStartKey between pages)
+    and converts each item from DynamoDB JSON; ExpressionAttributeValues may be
+    given as plain Python values.
+    """
+    if 'ExpressionAttributeValues' in kwargs:
+        kwargs['ExpressionAttributeValues'] = {
+            name: _serializer.serialize(value)
+            for name, value in kwargs['ExpressionAttributeValues'].items()
+        }
+
+    # No Limit: the 1 MB page cap is applied to items read before projection,
+    # so a Limit can only shrink pages and add round trips here
+    paginator = dynamodb_client.get_paginator(operation)
+    for page in paginator.paginate(TableName=table_name, **kwargs):
+        for item in page['Items']:
+            yield {name: _deserializer.deserialize(value) for name, value in item.items()}
+
+
+def _query_unique(table_name, attribute, **query_kwargs):
+    """Query a table or index and collect the unique values of one attribute"""
+    # Fold items into the set as pages arrive instead of accumulating them
+    return {
+        item[attribute]
+        for item in _paginate_items('query', table_name, **query_kwargs)
+        if attribute in item
+    }
+
+
+def _scan_segment(table_name, attribute, scan_kwargs, segment, total_segments):
+    """Scan one segment of a table and collect the unique values of one attribute"""
+    return {
+        item[attribute]
+        for item in _paginate_items(
+            'scan', table_name, Segment=segment, TotalSegments=total_segments, **scan_kwargs
+        )
+        if attribute in item
+    }
+
+
+def _parallel_scan(table_name, attribute, **scan_kwargs):
+    """Scan a full table using concurrent segmented scans, returning unique attribute values"""
+    futures = [
+        _scan_executor.submit(_scan_segment, table_name, attribute, scan_kwargs, segment, SCAN_SEGMENTS)
+        for segment in range(SCAN_SEGMENTS)
+    ]
+    seen = set()
+    for future in as_completed(futures):
+        seen.update(future.result())
+    return seen
+
+
 # ============================================================================
 # DATA DISCOVERY ENDPOINTS
 # ============================================================================
 
 @app.route('/api/sites', methods=['GET'])
 @require_auth
+@cache.cached(query_string=True, response_filter=_is_success)
 def get_sites():
     """Get list of all sites"""
     try:
-        # Scan pads table for unique sites, excluding items without 'site' attribute
-        all_items = []
-        scan_kwargs = {
-            'ProjectionExpression': '#site',
-            'FilterExpression': 'attribute_exists(#site)',
-            'ExpressionAttributeNames': {'#site': 'site'}
-        }
-
-        # Handle pagination
-        response = pads_table.scan(**scan_kwargs)
-        all_items.extend(response['Items'])
-
-        while 'LastEvaluatedKey' in response:
-            scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
-            response = pads_table.scan(**scan_kwargs)
-            all_items.extend(response['Items'])
+        sites = set()
+        try:
+            # Query the sparse AllPadsIndex instead of scanning the whole pads table
+            sites = _query_unique(
+                PADS_TABLE,
+                'site',
+                IndexName=ALL_PADS_INDEX,
+                KeyConditionExpression='entity_type = :pad',
+                ProjectionExpression='#site',
+                ExpressionAttributeNames={'#site': 'site'},
+                ExpressionAttributeValues={':pad': 'pad'}
+            )
+        except ClientError as e:
+            if not is_missing_index_error(e):
+                raise
+            logger.warning(f"{ALL_PADS_INDEX} unavailable, falling back to scan: {e}")
+
+        if not sites:
+            # Index missing, or pads not yet backfilled with entity_type
+            # (scripts/backfill_entity_type.py)
+            sites = _parallel_scan(
+                PADS_TABLE,
+                'site',
+                ProjectionExpression='#site',
+                FilterExpression='attribute_exists(#site)',
+                ExpressionAttributeNames={'#site': 'site'}
+            )
 
-        # Extract unique sites
-        sites = sorted(list(set(item['site'] for item in all_items)))
-        return jsonify(sites)
+        return jsonify(sorted(sites))
     except Exception as e:
         logger.error(f"Error fetching sites: {e}")
         return jsonify({'error': str(e)}), 500
@@ -106,6 +372,7 @@ def get_sites():
 
 @app.route('/api/sectors', methods=['GET'])
 @require_auth
+@cache.cached(query_string=True, response_filter=_is_success)
 def get_sectors():
     """Get list of sectors for a site"""
     site = request.args.get('site')
@@ -113,30 +380,48 @@ def get_sectors():
         return jsonify({'error': 'site parameter required'}), 400
 
     try:
-        # Scan pads table for sectors in this site
-        all_items = []
-        scan_kwargs = {
-            'FilterExpression': '#site = :site AND attribute_exists(#sector)',
-            'ExpressionAttributeNames': {
-                '#site': 'site',
-                '#sector': 'sector'
-            },
-            'ExpressionAttributeValues': {':site': site},
-            'ProjectionExpression': '#sector'
-        }
-
-        # Handle pagination
-        response = pads_table.scan(**scan_kwargs)
-        all_items.extend(response['Items'])
-
-        while 'LastEvaluatedKey' in response:
-            scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
-            response = pads_table.scan(**scan_kwargs)
-            all_items.extend(response['Items'])
+        sectors = set()
+        try:
+            # site_sector is "{site}_{sector}"; the filter drops other sites
+            # whose names merely start with this site's name
+            sectors = _query_unique(
+                PADS_TABLE,
+                'sector',
+                IndexName=ALL_PADS_INDEX,
+                KeyConditionExpression='entity_type = :pad AND begins_with(site_sector, :prefix)',
+                FilterExpression='#site = :site',
+                ProjectionExpression='#sector',
+                ExpressionAttributeNames={
+                    '#site': 'site',
+                    '#sector': 'sector'
+                },
+                ExpressionAttributeValues={
+                    ':pad': 'pad',
+                    ':prefix': f"{site}_",
+                    ':site': site
+                }
+            )
+        except ClientError as e:
+            if not is_missing_index_error(e):
+                raise
+            logger.warning(f"{ALL_PADS_INDEX} unavailable, falling back to scan: {e}")
+
+        if not sectors:
+            # Index missing, or the site's pads not yet backfilled with
+            # entity_type (scripts/backfill_entity_type.py)
+            sectors = _parallel_scan(
+                PADS_TABLE,
+                'sector',
+                FilterExpression='#site = :site AND attribute_exists(#sector)',
+                ExpressionAttributeNames={
+                    '#site': 'site',
+                    '#sector': 'sector'
+                },
+                ExpressionAttributeValues={':site': site},
+                ProjectionExpression='#sector'
+            )
 
-        # Extract unique sectors
-        sectors = sorted(list(set(item['sector'] for item in all_items)))
-        return jsonify(sectors)
+        return jsonify(sorted(sectors))
     except Exception as e:
         logger.error(f"Error fetching sectors: {e}")
         return jsonify({'error': str(e)}), 500
@@ -144,6 +429,7 @@ def get_sectors():
 
 @app.route('/api/periods', methods=['GET'])
 @require_auth
+@cache.cached(query_string=True, response_filter=_is_success)
 def get_periods():
     """Get list of periods for a site and sector"""
     site = request.args.get('site')
@@ -153,19 +439,21 @@ def get_periods():
         return jsonify({'error': 'site and sector parameters required'}), 400
 
     try:
-        # Query images table for periods
-        response = images_table.scan(
-            FilterExpression='site_id = :site AND sector_id = :sector',
+        # Query the images GSI for this site's "{sector}#{period}" sort keys.
+        # Only the key attribute is projected, so the index projection doesn't matter.
+        sector_periods = _query_unique(
+            IMAGES_TABLE,
+            'sector_period',
+            IndexName='SiteSectorPeriodIndex',
+            KeyConditionExpression='site_id = :site AND begins_with(sector_period, :prefix)',
+            ProjectionExpression='sector_period',
             ExpressionAttributeValues={
-                ':site': site,
-                ':sector': sector
-            },
-            ProjectionExpression='period'
+                ':site': site.lower(),
+                ':prefix': f"{sector.lower()}#"
+            }
         )
-        periods = list(set(item['period'] for item in response['Items']))
-        periods.sort(reverse=True)  # Most recent first
-
-        return jsonify(periods)
+        periods = {sector_period.split('#', 1)[1] for sector_period in sector_periods}
+        return jsonify(sorted(periods, reverse=True))  # Most recent first
     except Exception as e:
         logger.error(f"Error fetching periods: {e}")
         return jsonify({'error': str(e)}), 500
@@ -173,6 +461,7 @@ def get_periods():
 
 @app.route('/api/pads', methods=['GET'])
 @require_auth
+@cache.cached(make_cache_key=_pads_request_cache_key, response_filter=_is_complete_pads_list)
 def get_pads():
     """Get list of pads for a site and sector (filtered by completeness)"""
     site = request.args.get('site')
@@ -183,18 +472,22 @@ def get_pads():
         return jsonify({'error': 'site and sector parameters required'}), 400
 
     try:
-        # Query pads table
-        response = pads_table.query(
+        # Query pads table (paginated; a sector's pads can exceed one 1 MB page)
+        items = list(_paginate_items(
+            'query',
+            PADS_TABLE,
             IndexName='SiteSectorDateIndex',
             KeyConditionExpression='site_sector = :ss',
+            # Only the fields returned below; pad items carry much more
+            ProjectionExpression='pad_id, pad_name, geo_location_area',
             ExpressionAttributeValues={':ss': f"{site}_{sector}"}
-        )
+        ))
 
         pads = [{
             'pad_id': item['pad_id'],
             'pad_name': item.get('pad_name', item['pad_id'].split('_PAD_')[-1]),
             'geo_location_area': decimal_to_float(item.get('geo_location_area', []))
-        } for item in response['Items']]
+        } for item in items]
 
         # Debug: Log what pads were returned by the query
         logger.info(f"Pads from table query: {[p['pad_id'] for p in pads]}")
@@ -202,17 +495,26 @@ def get_pads():
         # Filter by completeness if period is provided
         if period:
             logger.info(f"Filtering pads for completeness: {site}/{sector}/{period}")
+            # Each check is I/O bound (DynamoDB + S3), so run them concurrently
+            def check(pad):
+                try:
+                    return pad, mosaic_service.check_pad_completeness(site, sector, period, pad['pad_id'])
+                except Exception as e:
+                    logger.warning(f"{pad['pad_id']}: completeness unknown, listing it anyway - {e}")
+                    return pad, None
+
             complete_pads = []
-            for pad in pads:
-                is_complete = mosaic_service.check_pad_completeness(
-                    site, sector, period, pad['pad_id']
-                )
-                if is_complete:
+            for pad, is_complete in _completeness_executor.map(check, pads):
+                if is_complete is None:
+                    # Listed rather than hidden; the response isn't cached
+                    complete_pads.append(dict(pad, completeness_unknown=True))
+                    g.pads_completeness_unknown = True
+                elif is_complete:
                     complete_pads.append(pad)
                 else:
                     logger.debug(f"Filtered out incomplete pad: {pad['pad_id']}")
             pads = complete_pads
-            logger.info(f"Returning {len(pads)} complete pads (filtered from {len(response['Items'])} total)")
+            logger.info(f"Returning {len(pads)} complete pads (filtered from {len(items)} total)")
 
         # Sort by pad_name
         pads.sort(key=lambda x: x['pad_name'])
@@ -273,6 +575,29 @@ def get_orthomosaic_url():
         return jsonify({'error': str(e)}), 500
 
 
+@app.route('/api/mosaic/overview', methods=['GET'])
+@require_auth
+def get_mosaic_overview():
+    """Get orthomosaic URL, metadata, coverage stats and completeness for a pad in one call"""
+    site = request.args.get('site')
+    sector = request.args.get('sector')
+    period = request.args.get('period')
+    pad_id = request.args.get('pad_id')
+    mosaic_type = request.args.get('mosaic_type', 'optical')
+
+    if not all([site, sector, period, pad_id]):
+        return jsonify({'error': 'site, sector, period, and pad_id required'}), 400
+
+    try:
+        overview = mosaic_service.get_pad_overview(
+            site, sector, period, pad_id, mosaic_type
+        )
+        return jsonify(decimal_to_float(overview))
+    except Exception as e:
+        logger.error(f"Error fetching mosaic overview: {e}")
+        return jsonify({'error': str(e)}), 500
+
+
 @app.route('/api/mosaic/cameras', methods=['GET'])
 @require_auth
 def get_cameras():
@@ -287,10 +612,10 @@ def get_cameras():
         return jsonify({'error': 'site, sector, period, and pad_id required'}), 400
 
     try:
-        geojson = camera_service.get_camera_positions(
+        members = camera_service.iter_camera_collection(
             site, sector, period, pad_id, mosaic_type
         )
-        return jsonify(geojson)
+        return Response(_stream_feature_collection(members), mimetype='application/json')
     except Exception as e:
         logger.error(f"Error fetching camera positions: {e}")
         return jsonify({'error': str(e)}), 500
@@ -339,6 +664,107 @@ def get_thermal_stats(image_id):
         return jsonify({'error': str(e)}), 500
 
 
+@app.route('/api/images/urls', methods=['POST'])
+@require_auth
+def get_image_urls():
+    """
+    Get presigned URLs for many images in one request.
+
+    Image records are read with BatchGetItem, then presigning (and colorbar
+    checks) run concurrently on a pool sized to the S3 client's connection
+    pool, so N images cost a few round trips instead of N.
+
+    Request Body (JSON):
+        {
+            "image_ids": ["leyte_tongonan_20250409_0379", ...],
+            "kind": "thermal",       # "thermal" (default) or "optical"
+            "palette": "medical"     # thermal only
+        }
+
+    Returns:
+        JSON with 'urls' keyed by image_id (same shape as the single-image
+        endpoints) and 'errors' keyed by image_id for images that failed
+    """
+    data = request.get_json(silent=True)
+    if not data:
+        return jsonify({'error': 'No data provided'}), 400
+
+    image_ids = data.get('image_ids')
+    kind = data.get('kind', 'thermal')
+    palette = data.get('palette', 'medical')
+
+    if not isinstance(image_ids, list) or not all(isinstance(i, str) for i in image_ids):
+        return jsonify({'error': 'image_ids must be an array of strings'}), 400
+    if len(image_ids) > MAX_BATCH_IMAGE_IDS:
+        return jsonify({'error': f'At most {MAX_BATCH_IMAGE_IDS} image_ids per request'}), 400
+    if kind not in ('thermal', 'optical'):
+        return jsonify({'error': "kind must be 'thermal' or 'optical'"}), 400
+
+    unique_ids = list(dict.fromkeys(image_ids))
+    try:
+        # One BatchGetItem per 100 ids instead of a get_item per image
+        items = image_service.get_items_bulk(unique_ids)
+    except Exception as e:
+        logger.error(f"Error batch fetching image records: {e}")
+        return jsonify({'error': str(e)}), 500
+
+    def lookup(image_id):
+        item = items.get(image_id)
+        if item is None:
+            raise ValueError(f"Image not found: {image_id}")
+        if kind == 'optical':
+            return {'url': image_service.get_optical_image_url(image_id, item=item)}
+        return image_service.get_thermal_image_url(image_id, palette, item=item)
+
+    futures = {image_id: _presign_executor.submit(lookup, image_id) for image_id in unique_ids}
+
+    urls = {}
+    errors = {}
+    for image_id, future in futures.items():
+        try:
+            urls[image_id] = future.result()
+        except Exception as e:
+            errors[image_id] = str(e)
+
+    logger.info(f"Generated {len(urls)} {kind} image URLs ({len(errors)} errors)")
+    return jsonify({'urls': urls, 'errors': errors})
+
+
+@app.route('/api/cache/images/<image_id>', methods=['DELETE'])
+@require_auth
+@require_admin
+def invalidate_image_cache(image_id):
+    """
+    Evict an image's cached record and presigned URLs.
+
+    For the ingest pipeline to call after rewriting an image record, so the
+    change is visible before the cache TTLs run out. The caches live in each
+    worker process, so only the worker serving this request is evicted; the
+    others catch up when their entries expire (ITEM_CACHE_TTL, URL_CACHE_TTL
+    in services.image_service).
+    """
+    image_service.invalidate_image(image_id)
+    return jsonify({'invalidated': image_id})
+
+
+@app.route('/api/cache/pads/<site>/<sector>/<period>/<pad_id>', methods=['DELETE'])
+@require_auth
+@require_admin
+def invalidate_pad_cache(site, sector, period, pad_id):
+    """
+    Evict a pad's cached completeness result and image records.
+
+    For the ingest pipeline to call after publishing a pad's mosaics, so the
+    pad is listed before the negative completeness TTL runs out. The cached
+    /api/pads?site=&sector=&period= response for these exact values is
+    dropped too; other spellings of the query (e.g. different case) keep
+    theirs for up to DISCOVERY_CACHE_TTL.
+    """
+    mosaic_service.invalidate_pad(site, sector, period, pad_id)
+    cache.delete(_pads_cache_key(site, sector, period))
+    return jsonify({'invalidated': pad_id})
+
+
 # ============================================================================
 # COVERAGE STATS ENDPOINT
 # ============================================================================
@@ -421,11 +847,16 @@ def get_sector_measurements(site, sector, period):
     Returns:
         JSON response with list of measurements for all pads in sector/period
 
+    Query params:
+        summary: "true" to return only measurement_id, pad_id, aggregate_stats
+            and geo_bounds per pad (omits region_measurements)
+
     Example:
-        GET /api/pipemeasure/measurements/leyte/malitbog/20250228-PMSB
+        GET /api/pipemeasure/measurements/leyte/malitbog/20250228-PMSB?summary=true
     """
     try:
-        measurements = pipemeasure_service.get_measurements_by_sector(site, sector, period)
+        summary = request.args.get('summary', '').lower() == 'true'
+        measurements = pipemeasure_service.get_measurements_by_sector(site, sector, period, summary=summary)
 
         return jsonify({
             'site': site,
@@ -586,15 +1017,27 @@ def generate_report():
 
         logger.info(f"Generating report for {data['site']}/{data['sector']} with {len(data['rows'])} rows")
 
-        # Generate PDF
-        pdf_bytes = report_service.generate_pdf(data)
+        # Generate PDF into a temp file so it is streamed from disk, not buffered
+        with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tf:
+            pdf_path = tf.name
+
+        @after_this_request
+        def remove_pdf(response):
+            try:
+                os.unlink(pdf_path)
+            except OSError as e:
+                logger.warning(f"Could not remove temp report {pdf_path}: {e}")
+            return response
+
+        report_service.generate_pdf_to(pdf_path, data)
 
         # Return PDF file
         return send_file(
-            io.BytesIO(pdf_bytes),
+            pdf_path,
             mimetype='application/pdf',
             as_attachment=True,
-            download_name=f"line-loss-report-{data['sector']}.pdf"
+            download_name=f"line-loss-report-{data['sector']}.pdf",
+            conditional=True
         )
 
     except FileNotFoundError as e:
@@ -635,12 +1078,16 @@ def root():
             'mosaic': [
                 '/api/mosaic/metadata',
                 '/api/mosaic/orthomosaic',
+                '/api/mosaic/overview',
                 '/api/mosaic/cameras'
             ],
             'images': [
                 '/api/optical/{image_id}',
                 '/api/thermal/{image_id}?palette={palette}',
-                '/api/thermal/{image_id}/stats'
+                '/api/thermal/{image_id}/stats',
+                '/api/images/urls (POST)',
+                '/api/cache/images/{image_id} (DELETE)',
+                '/api/cache/pads/{site}/{sector}/{period}/{pad_id} (DELETE)'
             ],
             'stats': [
                 '/api/coverage/stats'
@@ -654,6 +1101,7 @@ def root():
 
 
 if __name__ == '__main__':
+    # Local development only; production runs under gunicorn (see gunicorn.conf.py)
     port = int(os.environ.get('PORT', 5001))
     logger.info(f"Starting Thermal Viewer Backend on port {port}")
     app.run(host='0.0.0.0', port=port, debug=False)
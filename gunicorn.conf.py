@@ -0,0 +1,27 @@
+"""
+Gunicorn configuration for the Thermal Viewer Backend.
+
+gthread workers let the ThreadPoolExecutor fan-out in app.py overlap across
+concurrent requests. Keep GUNICORN_THREADS at or below the boto3
+max_pool_connections in app.py so threads don't queue for HTTP connections.
+"""
+
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5001)}"
+workers = int(os.environ.get('GUNICORN_WORKERS', multiprocessing.cpu_count()))
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 16))
+
+# Heartbeat files on tmpfs; a disk-backed /tmp can stall workers into timeouts
+worker_tmp_dir = '/dev/shm'
+
+# Report generation can take up to the 60s LibreOffice conversion timeout
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 120))
+graceful_timeout = 30
+keepalive = 5
+
+accesslog = '-'
+errorlog = '-'
+loglevel = 'info'
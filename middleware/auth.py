@@ -6,12 +6,17 @@ Validates JWT tokens from AWS Cognito User Pool.
 
 import os
 import json
+import hashlib
 import time
 import logging
+import threading
 from functools import wraps
+from cachetools import TLRUCache
 from flask import request, jsonify, g
 import jwt
+from jwt.algorithms import RSAAlgorithm
 import requests
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
@@ -19,12 +24,33 @@ logger = logging.getLogger(__name__)
 COGNITO_REGION = os.environ.get('COGNITO_REGION', 'ap-southeast-1')
 COGNITO_USER_POOL_ID = os.environ.get('COGNITO_USER_POOL_ID', '')
 
-# Cache for JWKS (JSON Web Key Set)
+# Callers allowed on admin routes: users in this Cognito group, or service
+# clients (client credentials flow) granted this OAuth scope
+COGNITO_ADMIN_GROUP = os.environ.get('COGNITO_ADMIN_GROUP', 'admin')
+COGNITO_ADMIN_SCOPE = os.environ.get('COGNITO_ADMIN_SCOPE', '')
+
+# Cache for JWKS (JSON Web Key Set), stored as {kid: public key object}
 _jwks_cache = {
     'keys': None,
     'last_updated': 0
 }
 JWKS_CACHE_TTL = 3600  # 1 hour
+_jwks_lock = threading.Lock()
+
+# Shared HTTP session so JWKS refreshes reuse pooled keep-alive connections
+_http = requests.Session()
+_http.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=10))
+
+# Cache of already-verified token claims, keyed by SHA-256 of the token.
+# Entries expire at the token's own exp (minus leeway), or after TOKEN_CACHE_TTL.
+TOKEN_CACHE_TTL = 300  # 5 minutes
+TOKEN_EXP_LEEWAY = 5  # seconds
+_token_cache = TLRUCache(
+    maxsize=10_000,
+    ttu=lambda _key, claims, now: min(claims.get('exp', 0) - TOKEN_EXP_LEEWAY, now + TOKEN_CACHE_TTL),
+    timer=time.time
+)
+_token_cache_lock = threading.Lock()
 
 
 def get_jwks_url():
@@ -37,37 +63,55 @@ def get_issuer():
     return f"https://cognito-idp.{COGNITO_REGION}.amazonaws.com/{COGNITO_USER_POOL_ID}"
 
 
-def fetch_jwks():
-    """Fetch JWKS from Cognito, with caching"""
-    global _jwks_cache
+def fetch_jwks(force_refresh=False):
+    """
+    Fetch JWKS from Cognito and materialize the public keys, with caching
+
+    Refreshes are serialized behind a lock and re-checked once the lock is
+    held, so a cache expiry under load results in a single request to Cognito.
 
-    current_time = time.time()
+    Args:
+        force_refresh: Refetch even if the cache is still valid (e.g. unknown kid)
+    """
+    requested_at = time.time()
 
     # Return cached keys if still valid
-    if _jwks_cache['keys'] and (current_time - _jwks_cache['last_updated']) < JWKS_CACHE_TTL:
+    if not force_refresh and _jwks_cache['keys'] and (requested_at - _jwks_cache['last_updated']) < JWKS_CACHE_TTL:
         return _jwks_cache['keys']
 
-    try:
-        url = get_jwks_url()
-        logger.info(f"Fetching JWKS from {url}")
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        jwks = response.json()
+    with _jwks_lock:
+        current_time = time.time()
 
-        # Cache the keys
-        _jwks_cache['keys'] = {key['kid']: key for key in jwks['keys']}
-        _jwks_cache['last_updated'] = current_time
+        # Another thread may have refreshed the keys while we waited for the lock
+        if force_refresh:
+            if _jwks_cache['keys'] and _jwks_cache['last_updated'] >= requested_at:
+                return _jwks_cache['keys']
+        elif _jwks_cache['keys'] and (current_time - _jwks_cache['last_updated']) < JWKS_CACHE_TTL:
+            return _jwks_cache['keys']
 
-        logger.info(f"JWKS cached with {len(_jwks_cache['keys'])} keys")
-        return _jwks_cache['keys']
+        try:
+            url = get_jwks_url()
+            logger.info(f"Fetching JWKS from {url}")
+            response = _http.get(url, timeout=10)
+            response.raise_for_status()
+            jwks = response.json()
+
+            # Cache the keys already converted from JWK, so requests only do a dict lookup
+            _jwks_cache['keys'] = {
+                key['kid']: RSAAlgorithm.from_jwk(json.dumps(key)) for key in jwks['keys']
+            }
+            _jwks_cache['last_updated'] = current_time
 
-    except Exception as e:
-        logger.error(f"Error fetching JWKS: {e}")
-        # Return cached keys if available, even if expired
-        if _jwks_cache['keys']:
-            logger.warning("Using expired JWKS cache")
+            logger.info(f"JWKS cached with {len(_jwks_cache['keys'])} keys")
             return _jwks_cache['keys']
-        raise
+
+        except Exception as e:
+            logger.error(f"Error fetching JWKS: {e}")
+            # Return cached keys if available, even if expired
+            if _jwks_cache['keys']:
+                logger.warning("Using expired JWKS cache")
+                return _jwks_cache['keys']
+            raise
 
 
 def get_public_key(token):
@@ -84,19 +128,12 @@ def get_public_key(token):
 
         if kid not in jwks:
             # Refresh cache and try again
-            _jwks_cache['last_updated'] = 0
-            jwks = fetch_jwks()
+            jwks = fetch_jwks(force_refresh=True)
 
             if kid not in jwks:
                 raise ValueError(f"Public key not found for kid: {kid}")
 
-        key_data = jwks[kid]
-
-        # Convert JWK to PEM format
-        from jwt.algorithms import RSAAlgorithm
-        public_key = RSAAlgorithm.from_jwk(json.dumps(key_data))
-
-        return public_key
+        return jwks[kid]
 
     except Exception as e:
         logger.error(f"Error getting public key: {e}")
@@ -116,6 +153,13 @@ def validate_token(token):
     if not COGNITO_USER_POOL_ID:
         raise ValueError("COGNITO_USER_POOL_ID not configured")
 
+    # Skip signature verification for a token we've already verified
+    token_hash = hashlib.sha256(token.encode()).digest()
+    with _token_cache_lock:
+        claims = _token_cache.get(token_hash)
+    if claims is not None:
+        return claims
+
     try:
         public_key = get_public_key(token)
 
@@ -137,6 +181,9 @@ def validate_token(token):
         if token_use not in ['access', 'id']:
             raise ValueError(f"Invalid token_use: {token_use}")
 
+        with _token_cache_lock:
+            _token_cache[token_hash] = claims
+
         return claims
 
     except jwt.ExpiredSignatureError:
@@ -194,6 +241,8 @@ def require_auth(f):
                 'email': claims.get('email'),
                 'username': claims.get('username') or claims.get('cognito:username'),
                 'token_use': claims.get('token_use'),
+                'groups': claims.get('cognito:groups') or [],
+                'scopes': (claims.get('scope') or '').split(),
             }
 
             return f(*args, **kwargs)
@@ -208,6 +257,39 @@ def require_auth(f):
     return decorated
 
 
+def require_admin(f):
+    """
+    Decorator to restrict a route to admin users and service clients.
+
+    Apply below @require_auth. Callers need COGNITO_ADMIN_GROUP in their
+    cognito:groups claim, or COGNITO_ADMIN_SCOPE in their access token's
+    scope; anyone else gets 403. Unrestricted while authentication is
+    disabled (development mode).
+
+    Usage:
+        @app.route('/api/admin/thing', methods=['DELETE'])
+        @require_auth
+        @require_admin
+        def admin_route():
+            ...
+    """
+    @wraps(f)
+    def decorated(*args, **kwargs):
+        if request.method == 'OPTIONS' or not COGNITO_USER_POOL_ID:
+            return f(*args, **kwargs)
+
+        user = g.get('user') or {}
+        if COGNITO_ADMIN_GROUP in user.get('groups', []):
+            return f(*args, **kwargs)
+        if COGNITO_ADMIN_SCOPE and COGNITO_ADMIN_SCOPE in user.get('scopes', []):
+            return f(*args, **kwargs)
+
+        logger.warning(f"Admin access denied for {user.get('username') or user.get('sub')}")
+        return jsonify({'error': 'Admin access required'}), 403
+
+    return decorated
+
+
 def init_auth(app):
     """
     Initialize authentication middleware.
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Backfill colorbar_keys on image records
+
+Writes colorbar_keys = {palette: s3_key or None} onto every image record so
+ImageService can resolve colorbar URLs without a HEAD request per image.
+Existence is taken from one list_objects_v2 listing per palette rather than
+a HEAD per image.
+
+Usage:
+    python scripts/backfill_colorbar_keys.py [--palettes medical hotspot_alert] [--dry-run]
+
+colorbar_keys is replaced as a whole, so record every palette (the default)
+unless the items carry no other palettes. A palette missing from the map is
+still resolved with a HEAD probe by the backend.
+
+Environment:
+    AWS_REGION, S3_BUCKET, IMAGES_TABLE (same as the backend)
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+import boto3
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from services.image_service import colorbar_key_for  # noqa: E402
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+PALETTES = ['medical', 'hotspot_alert']
+
+
+def list_colorbar_keys(s3_client, bucket: str, palette: str) -> set:
+    """List every colorbar object stored under colored/{palette}/"""
+    keys = set()
+    paginator = s3_client.get_paginator('list_objects_v2')
+    for page in paginator.paginate(Bucket=bucket, Prefix=f"colored/{palette}/"):
+        for obj in page.get('Contents', []):
+            if obj['Key'].endswith('_colorbar.png'):
+                keys.add(obj['Key'])
+    logger.info(f"Found {len(keys)} {palette} colorbars")
+    return keys
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--palettes', nargs='+', default=PALETTES, help='Palettes to record (default: all)')
+    parser.add_argument('--dry-run', action='store_true', help='Report changes without writing')
+    args = parser.parse_args()
+
+    region = os.environ.get('AWS_REGION', 'ap-southeast-1')
+    bucket = os.environ['S3_BUCKET']
+    table = boto3.resource('dynamodb', region_name=region).Table(os.environ['IMAGES_TABLE'])
+    s3_client = boto3.client('s3', region_name=region)
+
+    existing = {palette: list_colorbar_keys(s3_client, bucket, palette) for palette in args.palettes}
+
+    scan_kwargs = {
+        'ProjectionExpression': 'image_id, site_id, sector_id, #period, thermal_filename',
+        'ExpressionAttributeNames': {'#period': 'period'}
+    }
+    updated = 0
+    while True:
+        response = table.scan(**scan_kwargs)
+        for item in response['Items']:
+            colorbar_keys = {}
+            for palette in args.palettes:
+                key = colorbar_key_for(item, palette)
+                colorbar_keys[palette] = key if key in existing[palette] else None
+
+            if not args.dry_run:
+                table.update_item(
+                    Key={'image_id': item['image_id']},
+                    UpdateExpression='SET colorbar_keys = :keys',
+                    ExpressionAttributeValues={':keys': colorbar_keys}
+                )
+            updated += 1
+
+        if 'LastEvaluatedKey' not in response:
+            break
+        scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+    action = 'Would update' if args.dry_run else 'Updated'
+    logger.info(f"{action} colorbar_keys on {updated} image records")
+
+
+if __name__ == '__main__':
+    main()
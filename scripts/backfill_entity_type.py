@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Backfill entity_type on pad records
+
+Writes entity_type = "pad" (and site_sector = "{site}_{sector}" where it is
+missing) onto every pad record that lacks it, so the sparse pads AllPadsIndex
+lists every pad. /api/sites and /api/sectors scan the pads table while the
+index returns nothing, but a partly indexed table serves only the indexed
+pads' sites and sectors, so run this before relying on the index.
+
+Usage:
+    python scripts/backfill_entity_type.py [--dry-run]
+
+Environment:
+    AWS_REGION, PADS_TABLE (same as the backend)
+"""
+
+import argparse
+import logging
+import os
+
+import boto3
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--dry-run', action='store_true', help='Report changes without writing')
+    args = parser.parse_args()
+
+    region = os.environ.get('AWS_REGION', 'ap-southeast-1')
+    table = boto3.resource('dynamodb', region_name=region).Table(os.environ['PADS_TABLE'])
+
+    scan_kwargs = {
+        'ProjectionExpression': 'pad_id, #site, sector, site_sector',
+        'FilterExpression': 'attribute_not_exists(entity_type) AND attribute_exists(#site) AND attribute_exists(sector)',
+        'ExpressionAttributeNames': {'#site': 'site'}
+    }
+    updated = 0
+    while True:
+        response = table.scan(**scan_kwargs)
+        for item in response['Items']:
+            if not args.dry_run:
+                table.update_item(
+                    Key={'pad_id': item['pad_id']},
+                    UpdateExpression='SET entity_type = :pad, site_sector = if_not_exists(site_sector, :site_sector)',
+                    ExpressionAttributeValues={
+                        ':pad': 'pad',
+                        ':site_sector': f"{item['site']}_{item['sector']}"
+                    }
+                )
+            updated += 1
+
+        if 'LastEvaluatedKey' not in response:
+            break
+        scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+    action = 'Would update' if args.dry_run else 'Updated'
+    logger.info(f"{action} entity_type on {updated} pad records")
+
+
+if __name__ == '__main__':
+    main()
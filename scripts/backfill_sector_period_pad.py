@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Backfill sector_period_pad on image records
+
+Writes sector_period_pad = "{sector}#{period}#{pad_id}" (built from the
+existing sector_period and pad_id) onto every image record that lacks it, so
+the images SiteSectorPeriodPadIndex can serve pad queries by key. Set
+USE_PAD_INDEX=true on the backend only after this has run and ingest writes
+sector_period_pad on new images; until then pads are read through
+SiteSectorPeriodIndex with a pad_id filter.
+
+Usage:
+    python scripts/backfill_sector_period_pad.py [--dry-run]
+
+Environment:
+    AWS_REGION, IMAGES_TABLE (same as the backend)
+"""
+
+import argparse
+import logging
+import os
+
+import boto3
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--dry-run', action='store_true', help='Report changes without writing')
+    args = parser.parse_args()
+
+    region = os.environ.get('AWS_REGION', 'ap-southeast-1')
+    table = boto3.resource('dynamodb', region_name=region).Table(os.environ['IMAGES_TABLE'])
+
+    scan_kwargs = {
+        'ProjectionExpression': 'image_id, sector_period, pad_id',
+        'FilterExpression': (
+            'attribute_not_exists(sector_period_pad) '
+            'AND attribute_exists(sector_period) AND attribute_exists(pad_id)'
+        )
+    }
+    updated = 0
+    while True:
+        response = table.scan(**scan_kwargs)
+        for item in response['Items']:
+            if not args.dry_run:
+                table.update_item(
+                    Key={'image_id': item['image_id']},
+                    UpdateExpression='SET sector_period_pad = :spp',
+                    ExpressionAttributeValues={':spp': f"{item['sector_period']}#{item['pad_id']}"}
+                )
+            updated += 1
+
+        if 'LastEvaluatedKey' not in response:
+            break
+        scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+    action = 'Would update' if args.dry_run else 'Updated'
+    logger.info(f"{action} sector_period_pad on {updated} image records")
+
+
+if __name__ == '__main__':
+    main()
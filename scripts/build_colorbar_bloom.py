@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Build the colorbar Bloom filter
+
+Lists every colorbar under colored/ and writes a Bloom filter of their keys
+to S3. With COLORBAR_BLOOM_KEY set, the backend loads it at startup and
+answers "no colorbar" for legacy image records (those without
+colorbar_keys) without a HEAD request. Run it nightly; colorbars added
+after a build are reported missing until the next build and backend
+restart, so new images should carry colorbar_keys from ingest.
+
+Usage:
+    python scripts/build_colorbar_bloom.py [--key bloom/colorbars.bloom] [--error-rate 0.01] [--dry-run]
+
+Environment:
+    AWS_REGION, S3_BUCKET (same as the backend)
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+import boto3
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from services.colorbar_bloom import BloomFilter  # noqa: E402
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def list_colorbar_keys(s3_client, bucket: str) -> list:
+    """List every colorbar object stored under colored/"""
+    keys = []
+    paginator = s3_client.get_paginator('list_objects_v2')
+    for page in paginator.paginate(Bucket=bucket, Prefix='colored/'):
+        for obj in page.get('Contents', []):
+            if obj['Key'].endswith('_colorbar.png'):
+                keys.append(obj['Key'])
+    logger.info(f"Found {len(keys)} colorbars")
+    return keys
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--key', default='bloom/colorbars.bloom', help='S3 key to write the filter to')
+    parser.add_argument('--error-rate', type=float, default=0.01, help='Target false positive rate')
+    parser.add_argument('--dry-run', action='store_true', help='Build the filter without uploading it')
+    args = parser.parse_args()
+
+    region = os.environ.get('AWS_REGION', 'ap-southeast-1')
+    bucket = os.environ['S3_BUCKET']
+    s3_client = boto3.client('s3', region_name=region)
+
+    keys = list_colorbar_keys(s3_client, bucket)
+    bloom = BloomFilter.for_capacity(len(keys), args.error_rate)
+    bloom.update(keys)
+    data = bloom.to_bytes()
+
+    if args.dry_run:
+        logger.info(f"Would write {len(data)} bytes ({bloom.num_hashes} hashes) to s3://{bucket}/{args.key}")
+        return
+
+    s3_client.put_object(Bucket=bucket, Key=args.key, Body=data, ContentType='application/octet-stream')
+    logger.info(f"Wrote {len(data)} bytes ({bloom.num_hashes} hashes) to s3://{bucket}/{args.key}")
+
+
+if __name__ == '__main__':
+    main()
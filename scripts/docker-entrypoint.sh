@@ -0,0 +1,24 @@
+#!/bin/bash
+set -e
+
+# Start a persistent LibreOffice listener for report PDF conversion, so each
+# report doesn't pay LibreOffice's multi-second cold start. It runs under the
+# system Python, which is the one that has the LibreOffice UNO bindings.
+# unoserver exits when LibreOffice dies or a conversion exceeds the timeout;
+# the loop restarts it so the listener doesn't stay down for the container's
+# lifetime (reports fall back to one-shot conversions while it restarts).
+if [ -n "$UNOSERVER_HOST" ]; then
+    (
+        while true; do
+            echo "Starting unoserver on ${UNOSERVER_HOST}:${UNOSERVER_PORT:-2003}..."
+            /usr/bin/python3 -m unoserver.server \
+                --interface "$UNOSERVER_HOST" \
+                --port "${UNOSERVER_PORT:-2003}" \
+                --conversion-timeout "${UNOSERVER_CONVERSION_TIMEOUT:-60}" || true
+            echo "unoserver exited; restarting in 2s"
+            sleep 2
+        done
+    ) &
+fi
+
+exec "$@"
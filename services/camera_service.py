@@ -3,18 +3,32 @@ Camera Service
 Handles camera position data from ODM outputs
 """
 
-import json
+import itertools
 import logging
 import math
-from typing import Dict
+from typing import Any, Dict, Iterator, Tuple
+
+import ijson
+from boto3.dynamodb.types import TypeDeserializer
+
+from services.pad_image_query import PadImageQuery
 
 logger = logging.getLogger(__name__)
 
+_deserializer = TypeDeserializer()
+
+# Only the attributes that end up on a camera feature
+_PAD_IMAGE_PROJECTION = (
+    'image_id, optical_filename, thermal_filename, '
+    'optical_metadata.gps_location.altitude, '
+    'thermal_metadata.temperature_max, thermal_metadata.temperature_min'
+)
+
 
 class CameraService:
     """Service for camera position operations"""
 
-    def __init__(self, s3_client, s3_bucket, images_table):
+    def __init__(self, s3_client, s3_bucket, images_table, dynamodb_client, use_pad_index: bool = False):
         """
         Initialize Camera Service
 
@@ -22,21 +36,38 @@ class CameraService:
             s3_client: Boto3 S3 client
             s3_bucket: S3 bucket name
             images_table: DynamoDB images table resource
+            dynamodb_client: Low-level boto3 DynamoDB client. Used for the pad
+                images query to skip the resource layer's marshalling; the
+                resource's own meta.client still marshals, so it won't do.
+            use_pad_index: Read pads by key from SiteSectorPeriodPadIndex (see
+                PadImageQuery)
         """
         self.s3 = s3_client
         self.s3_bucket = s3_bucket
         self.images_table = images_table
+        self.dynamodb_client = dynamodb_client
+        self.pad_images = PadImageQuery(dynamodb_client, images_table.name, use_pad_index)
 
-    def get_camera_positions(
+    def iter_camera_collection(
         self,
         site: str,
         sector: str,
         period: str,
         pad_id: str,
         mosaic_type: str
-    ) -> Dict:
+    ) -> Iterator[Tuple[str, Any]]:
         """
-        Get camera positions as GeoJSON with enriched metadata
+        Stream a pad's camera positions GeoJSON with enriched features
+
+        shots.geojson is parsed incrementally from the S3 body, so memory use
+        stays flat regardless of file size. Its top-level members are yielded
+        in file order as (name, value) pairs; the "features" value is itself
+        an iterator of enriched Feature dictionaries, to be consumed before
+        the next pair, and other members (type, crs, bbox, ...) are copied
+        as parsed. The S3 fetch, the images query and parsing up to the first
+        member (and its first feature) happen before this returns, so lookup
+        errors and a malformed file are raised to the caller rather than
+        surfacing mid-stream.
 
         Args:
             site: Site ID
@@ -46,69 +77,184 @@ class CameraService:
             mosaic_type: Mosaic type
 
         Returns:
-            GeoJSON FeatureCollection
+            Iterator of (member name, value) pairs
         """
         # Fetch shots.geojson from S3
         s3_key = f"mosaics/{site}/{sector}/{period}/{pad_id}/{mosaic_type}/viewer/shots.geojson"
 
         try:
             response = self.s3.get_object(Bucket=self.s3_bucket, Key=s3_key)
-            geojson = json.loads(response['Body'].read())
-
-            # Query images table to get image_id mapping
-            image_response = self.images_table.query(
-                IndexName='SiteSectorPeriodIndex',
-                KeyConditionExpression='site_id = :site AND sector_period = :sp',
-                FilterExpression='pad_id = :pad',
-                ExpressionAttributeValues={
-                    ':site': site,
-                    ':sp': f"{sector}#{period}",
-                    ':pad': pad_id
-                }
-            )
-
-            images = {img['optical_filename']: img for img in image_response['Items']}
-
-            # Enrich GeoJSON features with metadata
-            for feature in geojson.get('features', []):
-                optical_filename = feature['properties'].get('filename')
-
-                if optical_filename in images:
-                    img_record = images[optical_filename]
-
-                    # Add image_id for API calls
-                    feature['properties']['image_id'] = img_record['image_id']
-
-                    # Add thermal filename
-                    feature['properties']['thermal_filename'] = img_record.get('thermal_filename', '')
-
-                    # Add altitude if available
-                    optical_metadata = img_record.get('optical_metadata', {})
-                    gps_location = optical_metadata.get('gps_location', {})
-                    if 'altitude' in gps_location:
-                        feature['properties']['altitude'] = float(gps_location['altitude'])
-
-                    # Add temperature data if available
-                    thermal_metadata = img_record.get('thermal_metadata', {})
-                    if thermal_metadata:
-                        feature['properties']['temp_max'] = float(thermal_metadata.get('temperature_max', 0))
-                        feature['properties']['temp_min'] = float(thermal_metadata.get('temperature_min', 0))
-
-                # Extract yaw from ODM rotation data (rotation[0] is yaw in radians)
-                rotation = feature['properties'].get('rotation')
-                if rotation and len(rotation) >= 1:
-                    # rotation[0] is yaw/heading in radians (from OpenDroneMap)
-                    yaw_radians = rotation[0]
-                    # Convert to degrees
-                    yaw_degrees = yaw_radians * (180.0 / math.pi)
-                    # Normalize to 0-360 range
-                    yaw_normalized = yaw_degrees % 360.0
-                    feature['properties']['yaw'] = round(yaw_normalized, 1)
-                    logger.debug(f"Extracted yaw for {optical_filename}: {yaw_radians} rad = {yaw_normalized}°")
-
-            logger.info(f"Retrieved {len(geojson.get('features', []))} camera positions")
-            return geojson
+            body = response['Body']
+
+            try:
+                images = self._get_pad_images(site, sector, period, pad_id)
+            except Exception:
+                body.close()
+                raise
+
+            members = self._iter_members(body, images)
+            try:
+                name, value = next(members)
+            except StopIteration:
+                return iter(())
+            if isinstance(value, Iterator):
+                try:
+                    first_feature = next(value)
+                except StopIteration:
+                    pass
+                else:
+                    value = itertools.chain((first_feature,), value)
+            return itertools.chain(((name, value),), members)
 
         except Exception as e:
-            logger.error(f"Error fetching camera positions: {e}")
+            logger.error("Error fetching camera positions: %s", e)
             raise
+
+    def _get_pad_images(self, site: str, sector: str, period: str, pad_id: str) -> Dict:
+        """
+        Get image records for a pad keyed by optical filename
+
+        Queries by pad key where the table allows it (see PadImageQuery), so
+        only this pad's images are read (and billed) rather than the whole
+        sector/period filtered down to the pad.
+
+        Args:
+            site: Site ID
+            sector: Sector ID
+            period: Period
+            pad_id: Pad ID
+
+        Returns:
+            Dictionary mapping optical_filename to precomputed feature properties
+        """
+        pages = self.pad_images.pages(site, sector, period, pad_id, ProjectionExpression=_PAD_IMAGE_PROJECTION)
+
+        images = {}
+        for page in pages:
+            for raw in page['Items']:
+                img = {name: _deserializer.deserialize(value) for name, value in raw.items()}
+                images[img['optical_filename']] = self._feature_properties(img)
+        return images
+
+    @staticmethod
+    def _feature_properties(img_record: Dict) -> Dict:
+        """
+        Build the properties an image record contributes to its camera feature
+
+        Done once per image so the feature loop is a single dict update instead
+        of repeated nested lookups and Decimal-to-float conversions.
+
+        Args:
+            img_record: Image record from DynamoDB
+
+        Returns:
+            Dictionary of feature properties (image_id, thermal_filename and,
+            when available, altitude, temp_max and temp_min)
+        """
+        props = {
+            # image_id for API calls
+            'image_id': img_record['image_id'],
+            'thermal_filename': img_record.get('thermal_filename', '')
+        }
+
+        # Add altitude if available
+        gps_location = img_record.get('optical_metadata', {}).get('gps_location', {})
+        if 'altitude' in gps_location:
+            props['altitude'] = float(gps_location['altitude'])
+
+        # Add temperature data if available
+        thermal_metadata = img_record.get('thermal_metadata', {})
+        if thermal_metadata:
+            props['temp_max'] = float(thermal_metadata.get('temperature_max', 0))
+            props['temp_min'] = float(thermal_metadata.get('temperature_min', 0))
+
+        return props
+
+    def _iter_members(self, body, images: Dict) -> Iterator[Tuple[str, Any]]:
+        """
+        Parse the top-level members of a shots.geojson stream
+
+        Args:
+            body: S3 StreamingBody for shots.geojson
+            images: Precomputed feature properties keyed by optical filename
+
+        Yields:
+            (name, value) pairs; "features" (when an array) as an iterator of
+            enriched features sharing the parser, drained before moving on
+
+        Raises:
+            ValueError: If the document is not a JSON object
+        """
+        try:
+            events = ijson.parse(body, use_float=True)
+            _, event, _ = next(events)
+            if event != 'start_map':
+                raise ValueError("shots.geojson is not a GeoJSON object")
+
+            for _, event, name in events:
+                if event == 'end_map':
+                    break
+                _, event, value = next(events)
+                if name == 'features' and event == 'start_array':
+                    features = self._enrich_features(events, images)
+                    yield name, features
+                    for _ in features:
+                        pass
+                else:
+                    yield name, _read_value(events, event, value)
+        finally:
+            body.close()
+
+    def _enrich_features(self, events, images: Dict) -> Iterator[Dict]:
+        """
+        Parse the features array from shots.geojson parse events and enrich
+        them with image metadata
+
+        Args:
+            events: ijson parse events positioned just inside the features array
+            images: Precomputed feature properties keyed by optical filename
+
+        Yields:
+            Enriched GeoJSON Feature dictionaries
+        """
+        count = 0
+        for _, event, value in events:
+            if event == 'end_array':
+                break
+            feature = _read_value(events, event, value)
+            properties = feature['properties']
+            optical_filename = properties.get('filename')
+
+            image_props = images.get(optical_filename)
+            if image_props is not None:
+                properties.update(image_props)
+
+            # Extract yaw from ODM rotation data (rotation[0] is yaw in radians)
+            rotation = properties.get('rotation')
+            if rotation and len(rotation) >= 1:
+                # rotation[0] is yaw/heading in radians (from OpenDroneMap)
+                yaw_radians = rotation[0]
+                # Convert to degrees and normalize to 0-360 range
+                yaw_normalized = math.degrees(yaw_radians) % 360.0
+                properties['yaw'] = round(yaw_normalized, 1)
+                logger.debug("Extracted yaw for %s: %s rad = %s°", optical_filename, yaw_radians, yaw_normalized)
+
+            count += 1
+            yield feature
+
+        logger.info("Retrieved %s camera positions", count)
+
+
+def _read_value(events, event: str, value) -> Any:
+    """Build one JSON value from parse events, starting at its first event"""
+    builder = ijson.ObjectBuilder()
+    builder.event(event, value)
+    depth = 1 if event in ('start_map', 'start_array') else 0
+    while depth:
+        _, event, value = next(events)
+        builder.event(event, value)
+        if event in ('start_map', 'start_array'):
+            depth += 1
+        elif event in ('end_map', 'end_array'):
+            depth -= 1
+    return builder.value
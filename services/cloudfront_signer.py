@@ -0,0 +1,29 @@
+"""
+CloudFront Signer
+Builds a botocore CloudFrontSigner from a CloudFront key pair
+"""
+
+from botocore.signers import CloudFrontSigner
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import padding
+
+
+def make_cloudfront_signer(key_id: str, private_key_pem: bytes) -> CloudFrontSigner:
+    """
+    Create a signer for CloudFront signed URLs
+
+    Args:
+        key_id: CloudFront public key ID (the key registered in the
+            distribution's trusted key group)
+        private_key_pem: Matching RSA private key, PEM encoded
+
+    Returns:
+        CloudFrontSigner; generate_presigned_url() on it is purely local
+    """
+    private_key = serialization.load_pem_private_key(private_key_pem, password=None)
+
+    def rsa_signer(message: bytes) -> bytes:
+        # CloudFront requires RSA-SHA1 signatures
+        return private_key.sign(message, padding.PKCS1v15(), hashes.SHA1())
+
+    return CloudFrontSigner(key_id, rsa_signer)
@@ -0,0 +1,185 @@
+"""
+Colorbar Bloom Filter
+Compact set of colorbar S3 keys known to exist, built offline
+"""
+
+import hashlib
+import logging
+import math
+import struct
+import threading
+import time
+from typing import Iterable, Optional
+
+from botocore.exceptions import ClientError
+
+logger = logging.getLogger(__name__)
+
+# Serialized layout: magic, num_bits, num_hashes, then the bit array
+_MAGIC = b'CBLM'
+_HEADER = struct.Struct('>4sQI')
+
+
+class BloomFilter:
+    """
+    Bloom filter over string keys
+
+    A key that was added is always reported present; a key that was not is
+    reported present with probability ~error_rate. So "not in filter" is a
+    certain answer and "in filter" still needs the real lookup.
+    """
+
+    def __init__(self, num_bits: int, num_hashes: int, bits: Optional[bytearray] = None):
+        """
+        Initialize Bloom Filter
+
+        Args:
+            num_bits: Size of the bit array
+            num_hashes: Bit positions set per key
+            bits: Existing bit array (from from_bytes); empty if None
+        """
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self.bits = bits if bits is not None else bytearray((num_bits + 7) // 8)
+
+    @classmethod
+    def for_capacity(cls, capacity: int, error_rate: float = 0.01) -> 'BloomFilter':
+        """
+        Create an empty filter sized for capacity keys at error_rate false positives
+
+        Args:
+            capacity: Expected number of keys
+            error_rate: Target false positive rate
+
+        Returns:
+            Empty BloomFilter
+        """
+        capacity = max(capacity, 1)
+        num_bits = max(int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))), 8)
+        num_hashes = max(int(round(num_bits / capacity * math.log(2))), 1)
+        return cls(num_bits, num_hashes)
+
+    def _positions(self, key: str):
+        # Double hashing (Kirsch-Mitzenmacher): one digest gives every position
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1, h2 = struct.unpack('>QQ', digest)
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, key: str) -> None:
+        """Add a key"""
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def update(self, keys: Iterable[str]) -> None:
+        """Add every key in keys"""
+        for key in keys:
+            self.add(key)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+    def to_bytes(self) -> bytes:
+        """Serialize the filter (see from_bytes)"""
+        return _HEADER.pack(_MAGIC, self.num_bits, self.num_hashes) + bytes(self.bits)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'BloomFilter':
+        """
+        Deserialize a filter written by to_bytes
+
+        Raises:
+            ValueError: If data is not a serialized BloomFilter
+        """
+        if len(data) < _HEADER.size:
+            raise ValueError("Bloom filter data is truncated")
+        magic, num_bits, num_hashes = _HEADER.unpack_from(data)
+        bits = bytearray(data[_HEADER.size:])
+        if magic != _MAGIC or len(bits) != (num_bits + 7) // 8:
+            raise ValueError("Not a serialized bloom filter")
+        return cls(num_bits, num_hashes, bits)
+
+
+class ColorbarBloom:
+    """
+    Colorbar Bloom filter kept in step with its S3 object
+
+    Answers membership from the last loaded filter and, once reload_interval
+    has passed, re-reads the object if its ETag changed, so a nightly rebuild
+    is picked up without a restart. While no filter has loaded every key reads
+    as possibly present, which sends callers to the HEAD probe.
+    """
+
+    def __init__(self, s3_client, bucket: str, key: str, reload_interval: float = 3600):
+        """
+        Initialize Colorbar Bloom
+
+        Args:
+            s3_client: Boto3 S3 client
+            bucket: S3 bucket name
+            key: S3 key of the serialized filter
+            reload_interval: Seconds between checks for a rebuilt filter
+        """
+        self.s3 = s3_client
+        self.bucket = bucket
+        self.key = key
+        self.reload_interval = reload_interval
+        self.bloom: Optional[BloomFilter] = None
+        self._etag: Optional[str] = None
+        self._checked_at = 0.0
+        self._reload_lock = threading.Lock()
+
+    def __contains__(self, key: str) -> bool:
+        if time.monotonic() - self._checked_at >= self.reload_interval:
+            # One thread re-reads; the others keep answering from the old filter
+            if self._reload_lock.acquire(blocking=False):
+                try:
+                    self.reload()
+                finally:
+                    self._reload_lock.release()
+        bloom = self.bloom
+        return bloom is None or key in bloom
+
+    def reload(self) -> None:
+        """Load the filter if the S3 object changed since the last load"""
+        self._checked_at = time.monotonic()
+        get_kwargs = {'Bucket': self.bucket, 'Key': self.key}
+        if self._etag:
+            get_kwargs['IfNoneMatch'] = self._etag
+        try:
+            response = self.s3.get_object(**get_kwargs)
+            bloom = BloomFilter.from_bytes(response['Body'].read())
+        except ClientError as e:
+            if e.response['Error']['Code'] in ('304', 'NotModified'):
+                return
+            logger.warning("Colorbar bloom filter not loaded from s3://%s/%s: %s", self.bucket, self.key, e)
+            return
+        except ValueError as e:
+            logger.warning("Colorbar bloom filter not loaded from s3://%s/%s: %s", self.bucket, self.key, e)
+            return
+
+        self.bloom = bloom
+        self._etag = response.get('ETag')
+        logger.info(
+            "Loaded colorbar bloom filter from s3://%s/%s (%d bytes, %d hashes)",
+            self.bucket, self.key, len(bloom.bits), bloom.num_hashes
+        )
+
+
+def load_colorbar_bloom(s3_client, bucket: str, key: str, reload_interval: float = 3600) -> ColorbarBloom:
+    """
+    Load the colorbar Bloom filter written by scripts/build_colorbar_bloom.py
+
+    Args:
+        s3_client: Boto3 S3 client
+        bucket: S3 bucket name
+        key: S3 key of the serialized filter
+        reload_interval: Seconds between checks for a rebuilt filter
+
+    Returns:
+        ColorbarBloom; if the filter can't be read it reports every key as
+        possibly present (callers then probe S3 as before) until a reload succeeds
+    """
+    colorbar_bloom = ColorbarBloom(s3_client, bucket, key, reload_interval)
+    colorbar_bloom.reload()
+    return colorbar_bloom
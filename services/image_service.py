@@ -4,16 +4,180 @@ Handles image retrieval and temperature statistics
 """
 
 import logging
-from typing import Dict, Optional
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+from urllib.parse import quote
+from boto3.dynamodb.types import TypeDeserializer
 from botocore.exceptions import ClientError
+from cachetools import TTLCache
+
+from services.colorbar_bloom import ColorbarBloom
+from services.s3_presigner import S3Presigner
 
 logger = logging.getLogger(__name__)
 
+# Presigned URLs are valid for PRESIGN_EXPIRES_IN seconds and cached for half
+# of that, so a cached URL always has at least URL_CACHE_TTL seconds left.
+# With temporary (role) credentials a URL also dies with the credentials that
+# signed it, so cached URLs are keyed on the signing access key: botocore
+# refreshes role credentials 15 minutes before they expire, after which URLs
+# signed with the old key are no longer served.
+PRESIGN_EXPIRES_IN = 3600
+URL_CACHE_TTL = PRESIGN_EXPIRES_IN // 2
+URL_CACHE_MAXSIZE = 10_000
+
+# Image records are written once at ingest and read many times; keep them in
+# process for a few minutes (DELETE /api/cache/images/<id> evicts one early)
+ITEM_CACHE_TTL = 300
+ITEM_CACHE_MAXSIZE = 50_000
+
+_MISS = object()
+
+# Image records already read during the current request, keyed by image_id.
+# None outside a request (no memoization); see reset_request_item_cache().
+_request_items: ContextVar[Optional[Dict[str, Optional[Dict]]]] = ContextVar(
+    'image_item_cache', default=None
+)
+
+# Runs colorbar HEAD probes alongside thermal URL signing; kept below the S3
+# client's max_pool_connections (64) so probes never wait for a connection
+_IO_POOL = ThreadPoolExecutor(max_workers=32, thread_name_prefix='img-io')
+
+
+class _NativeNumberDeserializer(TypeDeserializer):
+    """TypeDeserializer returning int/float for numbers instead of Decimal"""
+
+    def _deserialize_n(self, value):
+        if '.' in value or 'e' in value or 'E' in value:
+            return float(value)
+        return int(value)
+
+
+_deserializer = _NativeNumberDeserializer()
+
+
+# BatchGetItem accepts at most 100 keys per call
+BATCH_GET_MAX_KEYS = 100
+BATCH_GET_MAX_RETRIES = 8
+
+# Attribute paths read by the URL and stats methods; everything else (notably
+# the rest of processing_status) is left behind. One projection serves all
+# methods so a record memoized for one can be reused by the others.
+IMAGE_ITEM_ATTRIBUTES = (
+    'image_id', 'optical_s3_key', 'colored_images', 'thermal_metadata', 'calibration',
+    'processing_status.colormapping.medical.temperature_stats',
+    'site_id', 'sector_id', 'period', 'thermal_filename', 'colorbar_keys'
+)
+
+
+def _build_projection(paths):
+    """Build a ProjectionExpression aliasing every path segment (reserved words are common)"""
+    names = {}
+    aliases = {}
+    expressions = []
+    for path in paths:
+        parts = []
+        for segment in path.split('.'):
+            if segment not in aliases:
+                aliases[segment] = f'#p{len(aliases)}'
+                names[aliases[segment]] = segment
+            parts.append(aliases[segment])
+        expressions.append('.'.join(parts))
+    return ', '.join(expressions), names
+
+
+IMAGE_PROJECTION, IMAGE_PROJECTION_NAMES = _build_projection(IMAGE_ITEM_ATTRIBUTES)
+
+
+def _deserialize_item(raw: Dict) -> Dict:
+    """Convert a low-level DynamoDB item to Python values (numbers as int/float)"""
+    return {name: _deserializer.deserialize(value) for name, value in raw.items()}
+
+
+def reset_request_item_cache() -> None:
+    """
+    Start a fresh per-request image record cache
+
+    Call at the start of every request (Flask before_request). Worker threads
+    are reused across requests, so without a reset a thread would keep
+    serving records read by an earlier request.
+    """
+    _request_items.set({})
+
+
+def _deep_get(obj: Optional[Dict], *keys: str):
+    """Follow nested dict keys, returning None at the first missing or empty level"""
+    for key in keys:
+        if not obj:
+            return None
+        obj = obj.get(key)
+    return obj
+
+
+def _as_float(value) -> float:
+    """Return a stats value as float; missing values become 0.0"""
+    return float(value) if value is not None else 0.0
+
+
+def colorbar_key_for(item: Dict, palette: str) -> Optional[str]:
+    """
+    Build the S3 key where an image's colorbar would be stored
+
+    Colorbar path: colored/{palette}/{site}/{sector}/{period}/{image_name}_colorbar.png
+
+    Args:
+        item: DynamoDB image record
+        palette: Color palette (medical)
+
+    Returns:
+        S3 key, or None if the record lacks the fields to build it
+    """
+    site = item.get('site_id')
+    sector = item.get('sector_id')
+    period = item.get('period')
+
+    if not all([site, sector, period]):
+        logger.warning("Missing site/sector/period for colorbar lookup")
+        return None
+
+    # Get image name from thermal filename
+    # thermal_filename is like "DJI_0539_T.JPG" - need to strip extension
+    thermal_filename = item.get('thermal_filename')
+    if not thermal_filename:
+        # Fallback: derive from image_id (e.g., "leyte_mahanagdong-b_20250409_DJI_0539_T")
+        image_id = item.get('image_id', '')
+        parts = image_id.split('_')
+        if len(parts) >= 4:
+            # Extract the DJI part (last 3 parts typically: DJI_XXXX_T)
+            thermal_filename = '_'.join(parts[-3:])
+        else:
+            logger.warning("Cannot derive thermal filename from image_id: %s", image_id)
+            return None
+
+    # Strip file extension (.JPG, .jpg, etc.) from thermal_filename
+    image_name = thermal_filename.rsplit('.', 1)[0] if '.' in thermal_filename else thermal_filename
+
+    return f"colored/{palette}/{site}/{sector}/{period}/{image_name}_colorbar.png"
+
 
 class ImageService:
     """Service for image operations"""
 
-    def __init__(self, s3_client, s3_bucket, images_table):
+    def __init__(
+        self,
+        s3_client,
+        s3_bucket,
+        images_table,
+        dynamodb_client,
+        colorbar_base_url: Optional[str] = None,
+        presigner: Optional[S3Presigner] = None,
+        colorbar_bloom: Optional[ColorbarBloom] = None,
+        credentials=None
+    ):
         """
         Initialize Image Service
 
@@ -21,10 +185,188 @@ class ImageService:
             s3_client: Boto3 S3 client
             s3_bucket: S3 bucket name
             images_table: DynamoDB images table resource
+            dynamodb_client: Low-level boto3 DynamoDB client. Image records are
+                read with it and deserialized with numbers as int/float, so
+                callers never convert Decimals.
+            colorbar_base_url: Public (e.g. CloudFront) origin serving the bucket's
+                colored/ prefix. When set, colorbar URLs are plain
+                "{base}/{key}" links instead of presigned ones, so they stay
+                stable and browser-cacheable. Colorbars are legends, not imagery.
+            presigner: S3Presigner for s3_bucket; None to presign with s3_client
+            colorbar_bloom: Bloom filter of existing colorbar keys (see
+                scripts/build_colorbar_bloom.py), reloaded when rebuilt. Legacy
+                items whose colorbar key is not in it skip the HEAD probe.
+            credentials: botocore Credentials that s3_client and presigner sign
+                with; cached URLs are keyed on their access key. None keys
+                every URL on None (fine for long-term credentials).
         """
         self.s3 = s3_client
         self.s3_bucket = s3_bucket
         self.images_table = images_table
+        self.dynamodb_client = dynamodb_client
+        self.colorbar_base_url = colorbar_base_url.rstrip('/') if colorbar_base_url else None
+        self.presigner = presigner
+        self.colorbar_bloom = colorbar_bloom
+        self.credentials = credentials
+        # Generated URLs keyed by (image_id, 'optical'), (image_id, 'thermal', palette)
+        # and (colorbar_key,), each followed by the signing access key; a hit
+        # skips the DynamoDB read, S3 HEAD and signing
+        self._url_cache = TTLCache(maxsize=URL_CACHE_MAXSIZE, ttl=URL_CACHE_TTL)
+        self._url_cache_lock = threading.Lock()
+        # Projected image records by image_id (misses are not cached)
+        self._item_cache = TTLCache(maxsize=ITEM_CACHE_MAXSIZE, ttl=ITEM_CACHE_TTL)
+        self._item_cache_lock = threading.Lock()
+
+    def _presign(self, s3_key: str) -> str:
+        """Generate a presigned GET URL for an object in the images bucket"""
+        if self.presigner:
+            return self.presigner.presign_get(s3_key, PRESIGN_EXPIRES_IN)
+        return self.s3.generate_presigned_url(
+            'get_object',
+            Params={
+                'Bucket': self.s3_bucket,
+                'Key': s3_key
+            },
+            ExpiresIn=PRESIGN_EXPIRES_IN
+        )
+
+    def _signed_cache_key(self, key: tuple) -> tuple:
+        """Append the current signing access key to a URL cache key"""
+        return key + (self.credentials.access_key if self.credentials else None,)
+
+    def _cache_get(self, key):
+        """Return the cached value for key under the current access key, or _MISS"""
+        key = self._signed_cache_key(key)
+        with self._url_cache_lock:
+            return self._url_cache.get(key, _MISS)
+
+    def _cache_put(self, key, value) -> None:
+        """Cache value under key and the current access key for URL_CACHE_TTL seconds"""
+        key = self._signed_cache_key(key)
+        with self._url_cache_lock:
+            self._url_cache[key] = value
+
+    def _get_item_cached(self, image_id: str) -> Optional[Dict]:
+        """
+        Get an image record, reading DynamoDB at most once per request
+
+        Records come from the per-request memo, then the process-wide item
+        cache, then DynamoDB.
+
+        Args:
+            image_id: Image ID
+
+        Returns:
+            Image record projected to IMAGE_ITEM_ATTRIBUTES, or None if it
+            doesn't exist
+        """
+        request_items = _request_items.get()
+        if request_items is not None and image_id in request_items:
+            return request_items[image_id]
+
+        with self._item_cache_lock:
+            item = self._item_cache.get(image_id)
+
+        if item is None:
+            response = self.dynamodb_client.get_item(
+                TableName=self.images_table.name,
+                Key={'image_id': {'S': image_id}},
+                ProjectionExpression=IMAGE_PROJECTION,
+                ExpressionAttributeNames=IMAGE_PROJECTION_NAMES
+            )
+            item = _deserialize_item(response['Item']) if 'Item' in response else None
+            if item is not None:
+                with self._item_cache_lock:
+                    self._item_cache[image_id] = item
+
+        if request_items is not None:
+            request_items[image_id] = item
+        return item
+
+    def get_items_bulk(self, image_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Fetch many image records with BatchGetItem
+
+        Records in the process-wide item cache are served from it; the rest
+        are sent in chunks of 100. UnprocessedKeys (throttling or the 16 MB
+        response cap) are retried with jittered exponential backoff.
+
+        Args:
+            image_ids: Image IDs to fetch (duplicates are ignored)
+
+        Returns:
+            Dictionary mapping image_id to image record (projected to
+            IMAGE_ITEM_ATTRIBUTES); IDs with no record are absent
+
+        Raises:
+            RuntimeError: If keys are still unprocessed after the retries
+        """
+        table_name = self.images_table.name
+        unique_ids = list(dict.fromkeys(image_ids))
+
+        items = {}
+        with self._item_cache_lock:
+            for image_id in unique_ids:
+                item = self._item_cache.get(image_id)
+                if item is not None:
+                    items[image_id] = item
+        missing_ids = [image_id for image_id in unique_ids if image_id not in items]
+
+        for start in range(0, len(missing_ids), BATCH_GET_MAX_KEYS):
+            request_items = {
+                table_name: {
+                    'Keys': [{'image_id': {'S': image_id}} for image_id in missing_ids[start:start + BATCH_GET_MAX_KEYS]],
+                    'ProjectionExpression': IMAGE_PROJECTION,
+                    'ExpressionAttributeNames': IMAGE_PROJECTION_NAMES
+                }
+            }
+
+            for attempt in range(BATCH_GET_MAX_RETRIES + 1):
+                response = self.dynamodb_client.batch_get_item(RequestItems=request_items)
+                fetched = [_deserialize_item(raw) for raw in response.get('Responses', {}).get(table_name, [])]
+                with self._item_cache_lock:
+                    for item in fetched:
+                        items[item['image_id']] = item
+                        self._item_cache[item['image_id']] = item
+
+                request_items = response.get('UnprocessedKeys')
+                if not request_items:
+                    break
+                if attempt == BATCH_GET_MAX_RETRIES:
+                    raise RuntimeError(
+                        f"BatchGetItem left {len(request_items[table_name]['Keys'])} keys unprocessed"
+                    )
+                # 100 ms, 200 ms, 400 ms, ... with full jitter
+                time.sleep(random.uniform(0, 0.1 * (2 ** attempt)))
+
+        logger.info(
+            "Batch fetched %d of %d image records (%d from cache)",
+            len(items), len(unique_ids), len(unique_ids) - len(missing_ids)
+        )
+        return items
+
+    def invalidate_image(self, image_id: str) -> None:
+        """
+        Drop an image's cached record and URLs
+
+        Called when ingest rewrites the record, so the next read sees the
+        new version instead of waiting out the cache TTLs. Colorbar URLs are
+        keyed by S3 key rather than image and are left to expire.
+
+        Args:
+            image_id: Image ID
+        """
+        with self._item_cache_lock:
+            self._item_cache.pop(image_id, None)
+        with self._url_cache_lock:
+            # pop: an entry can expire between listing the keys and removing it
+            for key in [key for key in self._url_cache if key[0] == image_id and len(key) > 2]:
+                self._url_cache.pop(key, None)
+
+        request_items = _request_items.get()
+        if request_items is not None:
+            request_items.pop(image_id, None)
+        logger.info("Invalidated cached record and URLs for %s", image_id)
 
     def _get_colorbar_url(self, item: Dict, palette: str = 'medical') -> Optional[str]:
         """
@@ -32,6 +374,13 @@ class ImageService:
 
         Colorbar path: colored/{palette}/{site}/{sector}/{period}/{image_name}_colorbar.png
 
+        Items whose colorbar_keys map ({palette: key or None}, written at
+        ingest or by scripts/backfill_colorbar_keys.py) has an entry for the
+        palette need no S3 call to know whether the colorbar exists; only an
+        explicit None means there is none. Otherwise this falls back to a HEAD
+        probe, whose result (including a miss) is cached, unless the colorbar
+        Bloom filter says the key was absent when it was built.
+
         Args:
             item: DynamoDB image record
             palette: Color palette (medical)
@@ -40,74 +389,86 @@ class ImageService:
             Presigned URL or None if colorbar doesn't exist
         """
         try:
-            site = item.get('site_id')
-            sector = item.get('sector_id')
-            period = item.get('period')
-
-            if not all([site, sector, period]):
-                logger.warning(f"Missing site/sector/period for colorbar lookup")
-                return None
-
-            # Get image name from thermal filename
-            # thermal_filename is like "DJI_0539_T.JPG" - need to strip extension
-            thermal_filename = item.get('thermal_filename')
-            if not thermal_filename:
-                # Fallback: derive from image_id (e.g., "leyte_mahanagdong-b_20250409_DJI_0539_T")
-                image_id = item.get('image_id', '')
-                parts = image_id.split('_')
-                if len(parts) >= 4:
-                    # Extract the DJI part (last 3 parts typically: DJI_XXXX_T)
-                    thermal_filename = '_'.join(parts[-3:])
-                else:
-                    logger.warning(f"Cannot derive thermal filename from image_id: {image_id}")
+            colorbar_keys = item.get('colorbar_keys') or {}
+            if palette in colorbar_keys:
+                colorbar_key = colorbar_keys[palette]
+                if not colorbar_key:
                     return None
+                return self._presign_colorbar(colorbar_key)
 
-            # Strip file extension (.JPG, .jpg, etc.) from thermal_filename
-            image_name = thermal_filename.rsplit('.', 1)[0] if '.' in thermal_filename else thermal_filename
+            colorbar_key = colorbar_key_for(item, palette)
+            if not colorbar_key:
+                return None
+            if self.colorbar_bloom is not None and colorbar_key not in self.colorbar_bloom:
+                return None
 
-            # Construct colorbar S3 key
-            colorbar_key = f"colored/{palette}/{site}/{sector}/{period}/{image_name}_colorbar.png"
+            cache_key = (colorbar_key,)
+            cached = self._cache_get(cache_key)
+            if cached is not _MISS:
+                return cached
 
             # Check if colorbar exists
             try:
                 self.s3.head_object(Bucket=self.s3_bucket, Key=colorbar_key)
             except ClientError as e:
                 if e.response['Error']['Code'] == '404':
-                    logger.debug(f"Colorbar not found: {colorbar_key}")
+                    logger.debug("Colorbar not found: %s", colorbar_key)
+                    self._cache_put(cache_key, None)
                     return None
                 raise
 
-            # Generate presigned URL
-            url = self.s3.generate_presigned_url(
-                'get_object',
-                Params={
-                    'Bucket': self.s3_bucket,
-                    'Key': colorbar_key
-                },
-                ExpiresIn=3600
-            )
-
-            logger.info(f"Generated colorbar URL: {colorbar_key}")
-            return url
+            return self._presign_colorbar(colorbar_key)
 
         except Exception as e:
-            logger.error(f"Error generating colorbar URL: {e}")
+            logger.error("Error generating colorbar URL: %s", e)
             return None
 
-    def get_optical_image_url(self, image_id: str) -> str:
+    def _presign_colorbar(self, colorbar_key: str) -> str:
+        """
+        Generate (or reuse a cached) presigned URL for a colorbar known to exist
+
+        Args:
+            colorbar_key: S3 key of the colorbar image
+
+        Returns:
+            Presigned URL, or a static URL under colorbar_base_url if configured
+        """
+        if self.colorbar_base_url:
+            return f"{self.colorbar_base_url}/{quote(colorbar_key)}"
+
+        cache_key = (colorbar_key,)
+        cached = self._cache_get(cache_key)
+        # A cached None is a stale miss from the HEAD path; the key is known to exist
+        if cached is not _MISS and cached is not None:
+            return cached
+
+        url = self._presign(colorbar_key)
+        self._cache_put(cache_key, url)
+
+        logger.info("Generated colorbar URL: %s", colorbar_key)
+        return url
+
+    def get_optical_image_url(self, image_id: str, item: Optional[Dict] = None) -> str:
         """
         Generate presigned URL for optical image
 
         Args:
             image_id: Image ID
+            item: Image record already fetched (e.g. by get_items_bulk);
+                read from DynamoDB when None
 
         Returns:
             Presigned S3 URL
         """
+        cache_key = (image_id, 'optical')
+        cached = self._cache_get(cache_key)
+        if cached is not _MISS:
+            return cached
+
         try:
-            # Get image record from DynamoDB
-            response = self.images_table.get_item(Key={'image_id': image_id})
-            item = response.get('Item')
+            # Get image record from DynamoDB unless the caller already has it
+            if item is None:
+                item = self._get_item_cached(image_id)
 
             if not item:
                 raise ValueError(f"Image not found: {image_id}")
@@ -116,37 +477,43 @@ class ImageService:
             if not s3_key:
                 raise ValueError(f"No optical S3 key for image: {image_id}")
 
-            url = self.s3.generate_presigned_url(
-                'get_object',
-                Params={
-                    'Bucket': self.s3_bucket,
-                    'Key': s3_key
-                },
-                ExpiresIn=3600  # 1 hour
-            )
+            url = self._presign(s3_key)
+            self._cache_put(cache_key, url)
 
-            logger.info(f"Generated optical image URL for {image_id}")
+            logger.info("Generated optical image URL for %s", image_id)
             return url
 
         except Exception as e:
-            logger.error(f"Error generating optical image URL: {e}")
+            logger.error("Error generating optical image URL: %s", e)
             raise
 
-    def get_thermal_image_url(self, image_id: str, palette: str = 'medical') -> Dict:
+    def get_thermal_image_url(
+        self,
+        image_id: str,
+        palette: str = 'medical',
+        item: Optional[Dict] = None
+    ) -> Dict:
         """
         Generate presigned URL for colored thermal image and colorbar
 
         Args:
             image_id: Image ID
             palette: Color palette (medical or hotspot_alert)
+            item: Image record already fetched (e.g. by get_items_bulk);
+                read from DynamoDB when None
 
         Returns:
             Dictionary with 'url' (thermal image) and 'colorbar_url' (colorbar image or None)
         """
+        cache_key = (image_id, 'thermal', palette)
+        cached = self._cache_get(cache_key)
+        if cached is not _MISS:
+            return dict(cached)
+
         try:
-            # Get image record from DynamoDB
-            response = self.images_table.get_item(Key={'image_id': image_id})
-            item = response.get('Item')
+            # Get image record from DynamoDB unless the caller already has it
+            if item is None:
+                item = self._get_item_cached(image_id)
 
             if not item:
                 raise ValueError(f"Image not found: {image_id}")
@@ -158,109 +525,112 @@ class ImageService:
             if not s3_key:
                 raise ValueError(f"No {palette} thermal image for {image_id}")
 
-            url = self.s3.generate_presigned_url(
-                'get_object',
-                Params={
-                    'Bucket': self.s3_bucket,
-                    'Key': s3_key
-                },
-                ExpiresIn=3600  # 1 hour
-            )
-
-            # Get colorbar URL (may be None if colorbar doesn't exist)
-            colorbar_url = self._get_colorbar_url(item, palette)
+            # Get colorbar URL (may be None if colorbar doesn't exist). Items
+            # without the palette in colorbar_keys may need a HEAD probe; run
+            # it while the thermal URL is signed instead of after it.
+            if palette not in (item.get('colorbar_keys') or {}):
+                colorbar_future = _IO_POOL.submit(self._get_colorbar_url, item, palette)
+                url = self._presign(s3_key)
+                colorbar_url = colorbar_future.result()
+            else:
+                url = self._presign(s3_key)
+                colorbar_url = self._get_colorbar_url(item, palette)
 
-            logger.info(f"Generated thermal image URL ({palette}) for {image_id}")
-            return {
+            result = {
                 'url': url,
                 'colorbar_url': colorbar_url
             }
+            self._cache_put(cache_key, result)
+
+            logger.info("Generated thermal image URL (%s) for %s", palette, image_id)
+            return dict(result)
 
         except Exception as e:
-            logger.error(f"Error generating thermal image URL: {e}")
+            logger.error("Error generating thermal image URL: %s", e)
             raise
 
-    def get_thermal_stats(self, image_id: str) -> Dict:
+    def get_thermal_stats(self, image_id: str, item: Optional[Dict] = None) -> Dict:
         """
         Get temperature statistics for thermal image
 
         Args:
             image_id: Image ID
+            item: Image record already fetched (e.g. by get_items_bulk);
+                read from DynamoDB when None
 
         Returns:
             Dictionary with temperature statistics including dataset-wide temperature range
         """
         try:
-            # Get image record from DynamoDB
-            response = self.images_table.get_item(Key={'image_id': image_id})
-            item = response.get('Item')
+            # Get image record from DynamoDB unless the caller already has it
+            if item is None:
+                item = self._get_item_cached(image_id)
 
             if not item:
                 raise ValueError(f"Image not found: {image_id}")
 
-            thermal_metadata = item.get('thermal_metadata', {})
+            thermal_metadata = item.get('thermal_metadata') or {}
 
             # Check if image has calibration data
-            calibration = item.get('calibration', {})
+            calibration = item.get('calibration') or {}
             is_calibrated = calibration.get('status') == 'calibrated'
 
             if is_calibrated:
                 # Use calibrated temperatures
-                temp_delta = calibration.get('temperature_delta', {})
+                temp_delta = calibration.get('temperature_delta') or {}
+                params = calibration.get('params') or {}
                 stats = {
-                    'min_temp': float(thermal_metadata.get('temperature_min', 0)),
-                    'max_temp': float(temp_delta.get('max_calibrated', 0)),
-                    'avg_temp': float(temp_delta.get('avg_calibrated', 0)),
+                    'min_temp': _as_float(thermal_metadata.get('temperature_min')),
+                    'max_temp': _as_float(temp_delta.get('max_calibrated')),
+                    'avg_temp': _as_float(temp_delta.get('avg_calibrated')),
                     'is_calibrated': True,
                     'palette': 'medical',
                     'calibration_params': {
-                        'emissivity': float(calibration.get('params', {}).get('emissivity', 0)),
-                        'distance': float(calibration.get('params', {}).get('distance', 0)),
-                        'reflection': float(calibration.get('params', {}).get('reflection', 0)),
-                        'ambient_temp': float(calibration.get('params', {}).get('ambient_temp', 0)),
-                        'humidity': float(calibration.get('params', {}).get('humidity', 0))
+                        'emissivity': _as_float(params.get('emissivity')),
+                        'distance': _as_float(params.get('distance')),
+                        'reflection': _as_float(params.get('reflection')),
+                        'ambient_temp': _as_float(params.get('ambient_temp')),
+                        'humidity': _as_float(params.get('humidity'))
                     }
                 }
             else:
                 # Use original temperatures
                 stats = {
-                    'min_temp': float(thermal_metadata.get('temperature_min', 0)),
-                    'max_temp': float(thermal_metadata.get('temperature_max', 0)),
-                    'avg_temp': float(thermal_metadata.get('temperature_avg', 0)),
+                    'min_temp': _as_float(thermal_metadata.get('temperature_min')),
+                    'max_temp': _as_float(thermal_metadata.get('temperature_max')),
+                    'avg_temp': _as_float(thermal_metadata.get('temperature_avg')),
                     'is_calibrated': False,
                     'palette': 'medical',
                     'original_params': {
-                        'emissivity': float(thermal_metadata.get('emissivity', 0)),
-                        'distance': float(thermal_metadata.get('object_distance', 0)),
-                        'reflection': float(thermal_metadata.get('reflected_temperature', 0)),
-                        'ambient_temp': float(thermal_metadata.get('ambient_temperature', 0)),
-                        'humidity': float(thermal_metadata.get('relative_humidity', 0))
+                        'emissivity': _as_float(thermal_metadata.get('emissivity')),
+                        'distance': _as_float(thermal_metadata.get('object_distance')),
+                        'reflection': _as_float(thermal_metadata.get('reflected_temperature')),
+                        'ambient_temp': _as_float(thermal_metadata.get('ambient_temperature')),
+                        'humidity': _as_float(thermal_metadata.get('relative_humidity'))
                     }
                 }
 
             # Extract dataset-wide temperature range from colormapping metadata
-            processing_status = item.get('processing_status')
-            if processing_status:
-                colormapping = processing_status.get('colormapping')
-                if colormapping:
-                    medical_palette = colormapping.get('medical')
-                    if medical_palette:
-                        temperature_stats = medical_palette.get('temperature_stats')
-                        if temperature_stats:
-                            stats['dataset_temperature_range'] = {
-                                'min_temp_c': float(temperature_stats.get('min_temp_c', 0)),
-                                'max_temp_c': float(temperature_stats.get('max_temp_c', 0)),
-                                'mean_temp_c': float(temperature_stats.get('mean_temp_c', 0)),
-                                'normalization': temperature_stats.get('normalization', 'unknown'),
-                                'sample_size': int(temperature_stats.get('sample_size', 0))
-                            }
-                            logger.info(f"Retrieved dataset temperature range for {image_id}: "
-                                      f"{stats['dataset_temperature_range']['min_temp_c']:.1f} - "
-                                      f"{stats['dataset_temperature_range']['max_temp_c']:.1f} °C")
-
-            logger.info(f"Retrieved thermal stats for {image_id} (calibrated: {is_calibrated})")
+            temperature_stats = _deep_get(
+                item, 'processing_status', 'colormapping', 'medical', 'temperature_stats'
+            )
+            if temperature_stats:
+                dataset_range = {
+                    'min_temp_c': _as_float(temperature_stats.get('min_temp_c')),
+                    'max_temp_c': _as_float(temperature_stats.get('max_temp_c')),
+                    'mean_temp_c': _as_float(temperature_stats.get('mean_temp_c')),
+                    'normalization': temperature_stats.get('normalization', 'unknown'),
+                    'sample_size': int(temperature_stats.get('sample_size') or 0)
+                }
+                stats['dataset_temperature_range'] = dataset_range
+                logger.info(
+                    "Retrieved dataset temperature range for %s: %.1f - %.1f °C",
+                    image_id, dataset_range['min_temp_c'], dataset_range['max_temp_c']
+                )
+
+            logger.info("Retrieved thermal stats for %s (calibrated: %s)", image_id, is_calibrated)
             return stats
 
         except Exception as e:
-            logger.error(f"Error fetching thermal stats: {e}")
+            logger.error("Error fetching thermal stats: %s", e)
             raise
@@ -3,17 +3,198 @@ Mosaic Service
 Handles mosaic data retrieval from S3 and DynamoDB
 """
 
+import datetime
 import json
 import logging
-from typing import Dict, Optional
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from statistics import StatisticsError, fmean
+from typing import Dict, List, Optional, Set
+from urllib.parse import quote
+
+from boto3.dynamodb.types import TypeDeserializer
+from cachetools import TTLCache
+
+from services.pad_image_query import PadImageQuery
+from services.s3_presigner import S3Presigner
 
 logger = logging.getLogger(__name__)
 
+_deserializer = TypeDeserializer()
+
+# Coverage estimate for the DJI M2EA thermal camera, assuming nadir shots
+CAMERA_FOV_DEG = 68.9
+# DJI thermal sensor is 640x512; ground footprint height/width
+THERMAL_ASPECT_RATIO = 512 / 640
+# Assume 60% overlap between neighbouring images
+COVERAGE_OVERLAP_FACTOR = 0.4
+# Footprint width at altitude h is 2*h*tan(fov/2) and height is width*aspect,
+# so new ground covered per image is COVERAGE_AREA_PER_M2_ALTITUDE * h**2
+_GROUND_WIDTH_PER_M_ALTITUDE = 2 * math.tan(math.radians(CAMERA_FOV_DEG) / 2)
+COVERAGE_AREA_PER_M2_ALTITUDE = (
+    _GROUND_WIDTH_PER_M_ALTITUDE ** 2 * THERMAL_ASPECT_RATIO * COVERAGE_OVERLAP_FACTOR
+)
+
+# Orthomosaic URLs are valid for ORTHOMOSAIC_URL_EXPIRES_IN seconds and cached
+# for half of that, so a cached URL always has at least 30 minutes left. S3
+# presigned URLs are cached per signing access key, as in ImageService, so
+# rotated role credentials don't leave URLs from the old key in use.
+ORTHOMOSAIC_URL_EXPIRES_IN = 3600
+ORTHOMOSAIC_URL_CACHE_TTL = ORTHOMOSAIC_URL_EXPIRES_IN // 2
+ORTHOMOSAIC_URL_CACHE_MAXSIZE = 4096
+# Mosaic objects are uploaded without Cache-Control. Presigned URLs ask S3 to
+# send this header (signed response-cache-control override) so browsers keep
+# the multi-MB GeoTIFFs while the URL is handed out. A mosaic can be
+# regenerated under the same key, so the browser copy lives no longer than
+# the URL itself rather than being immutable.
+ORTHOMOSAIC_CACHE_CONTROL = f"public, max-age={ORTHOMOSAIC_URL_EXPIRES_IN}"
+
+# A pad's image records change only when its pipeline reruns; the metadata
+# and completeness endpoints share one read of them for a minute
+PAD_IMAGES_CACHE_TTL = 60
+PAD_IMAGES_CACHE_MAXSIZE = 512
+
+# Attributes those endpoints use; everything else stays in DynamoDB
+PAD_IMAGE_PROJECTION = 'image_id, processing_status.mosaic_prep, optical_metadata.gps_location.altitude'
+
+# Coverage also reads the S2 footprint cells. They can be large, so they are
+# read by get_coverage_stats alone and kept out of the shared, cached records.
+COVERAGE_PROJECTION = 'image_id, optical_metadata.gps_location.altitude, coverage_cells'
+
+# Completeness results per (site, sector, period, pad_id). A complete pad
+# stays complete, so positives are kept longer; negatives expire quickly so a
+# pad whose mosaics are still being published shows up soon after it lands.
+COMPLETENESS_CACHE_TTL = 300
+COMPLETENESS_NEGATIVE_CACHE_TTL = 30
+COMPLETENESS_CACHE_MAXSIZE = 8192
+
+# S3 listings for completeness checks run here. The pool is separate from the
+# executor that fans completeness checks out per pad (app.py), so nested
+# submits cannot deadlock.
+_S3_CHECK_POOL = ThreadPoolExecutor(max_workers=32, thread_name_prefix='s3-list')
+
+# Independent DynamoDB queries issued together within one request
+_QUERY_POOL = ThreadPoolExecutor(max_workers=16, thread_name_prefix='ddb-query')
+
+def _pad_image_from_raw(raw: Dict) -> Dict:
+    """
+    Convert a raw (DynamoDB JSON) pad image to the few fields the endpoints use
+
+    Walks the raw maps directly and deserializes only the leaves kept
+    (mosaic_prep's included_in and mosaic_s3_keys, and the altitude as float),
+    instead of running TypeDeserializer over the whole projected item.
+
+    Args:
+        raw: Item from a low-level query projected to PAD_IMAGE_PROJECTION
+            or COVERAGE_PROJECTION
+
+    Returns:
+        Image record shaped like the resource API's, holding only image_id,
+        processing_status.mosaic_prep.{included_in, mosaic_s3_keys},
+        optical_metadata.gps_location.altitude and coverage_cells where present
+    """
+    image = {'image_id': raw['image_id']['S']}
+
+    mosaic_prep = raw.get('processing_status', {}).get('M', {}).get('mosaic_prep')
+    if mosaic_prep is not None:
+        prep_map = mosaic_prep.get('M')
+        if prep_map is None:
+            image['processing_status'] = {'mosaic_prep': None}
+        else:
+            image['processing_status'] = {'mosaic_prep': {
+                name: _deserializer.deserialize(prep_map[name])
+                for name in ('included_in', 'mosaic_s3_keys') if name in prep_map
+            }}
+
+    coverage_cells = raw.get('coverage_cells')
+    if coverage_cells is not None:
+        image['coverage_cells'] = _deserializer.deserialize(coverage_cells)
+
+    altitude = (
+        raw.get('optical_metadata', {}).get('M', {})
+        .get('gps_location', {}).get('M', {})
+        .get('altitude', {}).get('N')
+    )
+    if altitude is not None:
+        image['optical_metadata'] = {'gps_location': {'altitude': float(altitude)}}
+
+    return image
+
+
+# Ingest may store each image's ground footprint as S2 cell tokens at this
+# level (~1,500 m^2 cells) under coverage_cells
+COVERAGE_CELL_LEVEL = 18
+EARTH_RADIUS_M = 6371008.8
+
+
+def _cells_coverage_area(images) -> Optional[float]:
+    """
+    Covered ground area from the union of the images' S2 footprint cells
+
+    Overlap between images is counted once, so no overlap factor is needed.
+    Cells at one level in a pad's few hundred metres have practically equal
+    areas, so the union's size times one cell's area is the total.
+
+    Args:
+        images: Image records
+
+    Returns:
+        Area in m^2, or None unless every image has coverage_cells
+    """
+    cells = set()
+    for img in images:
+        image_cells = img.get('coverage_cells')
+        if not image_cells:
+            return None
+        cells.update(image_cells)
+
+    # Imported here: only pads with ingest-written cells need it
+    from s2sphere import Cell, CellId
+    cell_area_sr = Cell(CellId.from_token(next(iter(cells)))).exact_area()
+    return len(cells) * cell_area_sr * EARTH_RADIUS_M ** 2
+
+
+def _iter_altitudes(images):
+    """Yield each image's altitude as float, skipping missing or zero values"""
+    for img in images:
+        altitude = ((img.get('optical_metadata') or {}).get('gps_location') or {}).get('altitude')
+        if altitude:
+            yield float(altitude)
+
+
+def _mean_altitude(images) -> float:
+    """
+    Average altitude of images that have one
+
+    Args:
+        images: Image records
+
+    Returns:
+        Mean altitude in metres, or 0 if no image has an altitude
+    """
+    try:
+        return fmean(_iter_altitudes(images))
+    except StatisticsError:
+        return 0
+
 
 class MosaicService:
     """Service for mosaic data operations"""
 
-    def __init__(self, s3_client, s3_bucket, images_table, jobs_table):
+    def __init__(
+        self,
+        s3_client,
+        s3_bucket,
+        images_table,
+        jobs_table,
+        dynamodb_client,
+        presigner: Optional[S3Presigner] = None,
+        cloudfront_domain: Optional[str] = None,
+        cloudfront_signer=None,
+        credentials=None,
+        use_pad_index: bool = False
+    ):
         """
         Initialize Mosaic Service
 
@@ -22,11 +203,110 @@ class MosaicService:
             s3_bucket: S3 bucket name
             images_table: DynamoDB images table resource
             jobs_table: DynamoDB jobs table resource
+            dynamodb_client: Low-level DynamoDB (or DAX) client; pad images are
+                queried with it and only the fields used are deserialized
+            presigner: S3Presigner for s3_bucket; None to presign with s3_client
+            cloudfront_domain: CloudFront distribution domain with the bucket
+                as origin. With cloudfront_signer, orthomosaic URLs are
+                CloudFront signed URLs so repeat views are served from the edge.
+            cloudfront_signer: botocore CloudFrontSigner (see
+                services.cloudfront_signer.make_cloudfront_signer)
+            credentials: botocore Credentials that s3_client and presigner sign
+                with; cached S3 URLs are keyed on their access key
+            use_pad_index: Read pads by key from SiteSectorPeriodPadIndex (see
+                PadImageQuery)
         """
         self.s3 = s3_client
         self.s3_bucket = s3_bucket
         self.images_table = images_table
         self.jobs_table = jobs_table
+        self.dynamodb_client = dynamodb_client
+        self.presigner = presigner
+        self.cloudfront_domain = cloudfront_domain if cloudfront_signer else None
+        self.cloudfront_signer = cloudfront_signer
+        self.credentials = credentials
+        self.pad_images = PadImageQuery(dynamodb_client, images_table.name, use_pad_index)
+        # Projected image records keyed by (site, sector, period, pad_id)
+        self._pad_images_cache = TTLCache(maxsize=PAD_IMAGES_CACHE_MAXSIZE, ttl=PAD_IMAGES_CACHE_TTL)
+        self._pad_images_lock = threading.Lock()
+        # Orthomosaic URLs keyed by (S3 key, signing access key); CloudFront
+        # URLs are signed with the key pair, so their access key is None
+        self._url_cache = TTLCache(maxsize=ORTHOMOSAIC_URL_CACHE_MAXSIZE, ttl=ORTHOMOSAIC_URL_CACHE_TTL)
+        self._url_cache_lock = threading.Lock()
+        self._complete_cache = TTLCache(maxsize=COMPLETENESS_CACHE_MAXSIZE, ttl=COMPLETENESS_CACHE_TTL)
+        self._incomplete_cache = TTLCache(maxsize=COMPLETENESS_CACHE_MAXSIZE, ttl=COMPLETENESS_NEGATIVE_CACHE_TTL)
+        self._completeness_lock = threading.Lock()
+
+    def _query_pad_images(self, site: str, sector: str, period: str, pad_id: str) -> List[Dict]:
+        """
+        Get a pad's image records, projected to PAD_IMAGE_PROJECTION
+
+        The query is keyed on the pad where the table allows it (see
+        PadImageQuery). Results are cached for PAD_IMAGES_CACHE_TTL seconds;
+        callers must not modify them.
+
+        Args:
+            site: Site ID
+            sector: Sector ID
+            period: Period
+            pad_id: Pad ID
+
+        Returns:
+            List of image records (empty if the pad has no images)
+        """
+        cache_key = (site, sector, period, pad_id)
+        with self._pad_images_lock:
+            images = self._pad_images_cache.get(cache_key)
+        if images is not None:
+            return images
+
+        images = [
+            _pad_image_from_raw(raw)
+            for page in self.pad_images.pages(
+                site, sector, period, pad_id, ProjectionExpression=PAD_IMAGE_PROJECTION
+            )
+            for raw in page.get('Items', [])
+        ]
+
+        with self._pad_images_lock:
+            self._pad_images_cache[cache_key] = images
+        logger.debug("Read %d image records for %s", len(images), pad_id)
+        return images
+
+    def _count_pad_images(self, site: str, sector: str, period: str, pad_id: str) -> int:
+        """
+        Count a pad's images server-side (Select='COUNT' returns no items)
+
+        Args:
+            site: Site ID
+            sector: Sector ID
+            period: Period
+            pad_id: Pad ID
+
+        Returns:
+            Number of images
+        """
+        # On the pad_id-filtered fallback Count is already the filtered count
+        return sum(
+            page['Count']
+            for page in self.pad_images.pages(site, sector, period, pad_id, Select='COUNT')
+        )
+
+    def _first_pad_image(self, site: str, sector: str, period: str, pad_id: str) -> Optional[Dict]:
+        """
+        Read one of a pad's images (Limit=1, projected to PAD_IMAGE_PROJECTION)
+
+        Args:
+            site: Site ID
+            sector: Sector ID
+            period: Period
+            pad_id: Pad ID
+
+        Returns:
+            Image record, or None if the pad has no images
+        """
+        raw = self.pad_images.first_item(site, sector, period, pad_id, ProjectionExpression=PAD_IMAGE_PROJECTION)
+        return _pad_image_from_raw(raw) if raw else None
 
     def get_orthomosaic_url(
         self,
@@ -47,23 +327,48 @@ class MosaicService:
             mosaic_type: Mosaic type (optical, medical, hotspot_alert)
 
         Returns:
-            Presigned S3 URL
+            CloudFront signed URL if CloudFront is configured, otherwise a
+            presigned S3 URL
         """
         s3_key = f"mosaics/{site}/{sector}/{period}/{pad_id}/{mosaic_type}/viewer/odm_orthophoto.tif"
+        access_key = None
+        if self.credentials and not self.cloudfront_domain:
+            access_key = self.credentials.access_key
+        cache_key = (s3_key, access_key)
+
+        with self._url_cache_lock:
+            url = self._url_cache.get(cache_key)
+        if url is not None:
+            logger.debug("Orthomosaic URL cache hit for %s", s3_key)
+            return url
 
         try:
-            url = self.s3.generate_presigned_url(
-                'get_object',
-                Params={
-                    'Bucket': self.s3_bucket,
-                    'Key': s3_key
-                },
-                ExpiresIn=3600  # 1 hour
-            )
-            logger.info(f"Generated orthomosaic URL for {s3_key}")
+            if self.cloudfront_domain:
+                url = self.cloudfront_signer.generate_presigned_url(
+                    f"https://{self.cloudfront_domain}/{quote(s3_key)}",
+                    date_less_than=datetime.datetime.utcnow() + datetime.timedelta(seconds=ORTHOMOSAIC_URL_EXPIRES_IN)
+                )
+            elif self.presigner:
+                url = self.presigner.presign_get(
+                    s3_key, ORTHOMOSAIC_URL_EXPIRES_IN,
+                    response_cache_control=ORTHOMOSAIC_CACHE_CONTROL
+                )
+            else:
+                url = self.s3.generate_presigned_url(
+                    'get_object',
+                    Params={
+                        'Bucket': self.s3_bucket,
+                        'Key': s3_key,
+                        'ResponseCacheControl': ORTHOMOSAIC_CACHE_CONTROL
+                    },
+                    ExpiresIn=ORTHOMOSAIC_URL_EXPIRES_IN
+                )
+            with self._url_cache_lock:
+                self._url_cache[cache_key] = url
+            logger.info("Generated orthomosaic URL for %s", s3_key)
             return url
         except Exception as e:
-            logger.error(f"Error generating orthomosaic URL: {e}")
+            logger.error("Error generating orthomosaic URL: %s", e)
             raise
 
     def get_mosaic_metadata(
@@ -87,34 +392,33 @@ class MosaicService:
         Returns:
             Metadata dictionary
         """
-        # Query images for this pad to get image count
         try:
-            response = self.images_table.query(
-                IndexName='SiteSectorPeriodIndex',
-                KeyConditionExpression='site_id = :site AND sector_period = :sp',
-                FilterExpression='pad_id = :pad',
-                ExpressionAttributeValues={
-                    ':site': site,
-                    ':sp': f"{sector}#{period}",
-                    ':pad': pad_id
-                }
-            )
-
-            images = response.get('Items', [])
+            # Reuse the pad's records if coverage/completeness already read them;
+            # otherwise a COUNT and a one-item query (run together) are cheaper
+            # than reading every record
+            cache_key = (site, sector, period, pad_id)
+            with self._pad_images_lock:
+                images = self._pad_images_cache.get(cache_key)
+
+            if images is not None:
+                image_count = len(images)
+                first_image = images[0] if images else None
+            else:
+                count_future = _QUERY_POOL.submit(self._count_pad_images, site, sector, period, pad_id)
+                first_image = self._first_pad_image(site, sector, period, pad_id)
+                image_count = count_future.result()
 
-            # Check if mosaic exists
+            # Check if mosaic exists, using one representative image's status
             mosaic_exists = False
-            if images:
-                # Check first image for mosaic processing status
-                first_image = images[0]
-                processing_status = first_image.get('processing_status', {})
-                mosaic_prep = processing_status.get('mosaic_prep', {})
-                mosaic_s3_keys = mosaic_prep.get('mosaic_s3_keys', {})
+            if first_image:
+                processing_status = first_image.get('processing_status') or {}
+                mosaic_prep = processing_status.get('mosaic_prep') or {}
+                mosaic_s3_keys = mosaic_prep.get('mosaic_s3_keys') or {}
                 mosaic_exists = mosaic_type in mosaic_s3_keys
 
             return {
                 'exists': mosaic_exists,
-                'image_count': len(images),
+                'image_count': image_count,
                 'site': site,
                 'sector': sector,
                 'period': period,
@@ -123,9 +427,52 @@ class MosaicService:
             }
 
         except Exception as e:
-            logger.error(f"Error fetching mosaic metadata: {e}")
+            logger.error("Error fetching mosaic metadata: %s", e)
             raise
 
+    def get_pad_overview(
+        self,
+        site: str,
+        sector: str,
+        period: str,
+        pad_id: str,
+        mosaic_type: str
+    ) -> Dict:
+        """
+        Get everything the viewer loads for a pad in one call
+
+        The pad's image records are read once (shared through the pad
+        images cache), then the completeness check's S3 listings and the
+        coverage query run on _QUERY_POOL while the URL and metadata are
+        built from the cached records, so the S3 and DynamoDB latencies
+        overlap instead of adding up across separate requests.
+
+        Args:
+            site: Site ID (lowercased for the completeness check only)
+            sector: Sector ID (lowercased for the completeness check only)
+            period: Period
+            pad_id: Pad ID
+            mosaic_type: Mosaic type (optical, medical, hotspot_alert)
+
+        Returns:
+            Dictionary with 'orthomosaic_url', 'metadata', 'coverage' and
+            'complete'
+        """
+        # Warm the entry the completeness check reads (it lowercases site and
+        # sector); the URL, metadata and coverage use the caller's values, as
+        # their own endpoints do, and share it when those are lowercase
+        self._query_pad_images(site.lower(), sector.lower(), period, pad_id)
+        complete_future = _QUERY_POOL.submit(self.check_pad_completeness, site, sector, period, pad_id)
+        coverage_future = _QUERY_POOL.submit(self.get_coverage_stats, site, sector, period, pad_id)
+
+        overview = {
+            'orthomosaic_url': self.get_orthomosaic_url(site, sector, period, pad_id, mosaic_type),
+            'metadata': self.get_mosaic_metadata(site, sector, period, pad_id, mosaic_type)
+        }
+        overview['coverage'] = coverage_future.result()
+        overview['complete'] = complete_future.result()
+        return overview
+
     def get_coverage_stats(
         self,
         site: str,
@@ -136,6 +483,11 @@ class MosaicService:
         """
         Get coverage statistics for a pad
 
+        The area is the union of the images' S2 footprint cells when every
+        image has coverage_cells ('coverage_method': 'cells'); otherwise it is
+        estimated from the average altitude, camera FOV and an assumed
+        overlap ('coverage_method': 'estimate').
+
         Args:
             site: Site ID
             sector: Sector ID
@@ -146,19 +498,14 @@ class MosaicService:
             Coverage statistics
         """
         try:
-            # Query images for this pad
-            response = self.images_table.query(
-                IndexName='SiteSectorPeriodIndex',
-                KeyConditionExpression='site_id = :site AND sector_period = :sp',
-                FilterExpression='pad_id = :pad',
-                ExpressionAttributeValues={
-                    ':site': site,
-                    ':sp': f"{sector}#{period}",
-                    ':pad': pad_id
-                }
-            )
-
-            images = response.get('Items', [])
+            # Own query rather than the shared pad records: only coverage needs the cells
+            images = [
+                _pad_image_from_raw(raw)
+                for page in self.pad_images.pages(
+                    site, sector, period, pad_id, ProjectionExpression=COVERAGE_PROJECTION
+                )
+                for raw in page.get('Items', [])
+            ]
 
             if not images:
                 return {
@@ -172,42 +519,30 @@ class MosaicService:
             total_images = len(images)
 
             # Get average altitude from optical metadata
-            altitudes = []
-            for img in images:
-                optical_metadata = img.get('optical_metadata', {})
-                gps_location = optical_metadata.get('gps_location', {})
-                altitude = gps_location.get('altitude')
-                if altitude:
-                    altitudes.append(float(altitude))
-
-            avg_altitude = sum(altitudes) / len(altitudes) if altitudes else 0
-
-            # Estimate coverage area (simplified calculation)
-            # Assuming DJI M2EA with 68.9° FOV
-            camera_fov = 68.9
-
-            # Calculate ground coverage per image at average altitude
-            # For simplicity, assume nadir shots
-            if avg_altitude > 0:
-                import math
-                fov_rad = math.radians(camera_fov)
-                ground_width = 2 * avg_altitude * math.tan(fov_rad / 2)
-                ground_height = ground_width * (512 / 640)  # DJI thermal aspect ratio
-                area_per_image = ground_width * ground_height
-                # Assume 60% overlap
-                total_area = area_per_image * total_images * 0.4
+            avg_altitude = _mean_altitude(images)
+
+            total_area = _cells_coverage_area(images)
+            if total_area is not None:
+                coverage_method = 'cells'
             else:
-                total_area = 0
+                # Estimate coverage area (simplified calculation) from the
+                # ground footprint per image at average altitude
+                coverage_method = 'estimate'
+                if avg_altitude > 0:
+                    total_area = COVERAGE_AREA_PER_M2_ALTITUDE * avg_altitude * avg_altitude * total_images
+                else:
+                    total_area = 0
 
             return {
                 'total_images': total_images,
                 'coverage_area_m2': round(total_area, 2),
                 'avg_altitude_m': round(avg_altitude, 2),
-                'camera_fov_deg': camera_fov
+                'camera_fov_deg': CAMERA_FOV_DEG,
+                'coverage_method': coverage_method
             }
 
         except Exception as e:
-            logger.error(f"Error calculating coverage stats: {e}")
+            logger.error("Error calculating coverage stats: %s", e)
             raise
 
     def check_pad_completeness(
@@ -216,6 +551,71 @@ class MosaicService:
         sector: str,
         period: str,
         pad_id: str
+    ) -> bool:
+        """
+        Check if a pad has all required mosaics, reusing a recent answer
+
+        Complete pads are cached for COMPLETENESS_CACHE_TTL seconds and
+        incomplete ones for COMPLETENESS_NEGATIVE_CACHE_TTL; see
+        _check_pad_completeness() for what complete means. A check that
+        fails (throttling, access denied) raises and caches nothing.
+
+        Args:
+            site: Site ID (will be normalized to lowercase)
+            sector: Sector ID (will be normalized to lowercase)
+            period: Period (YYYYMMDD or YYYYMMDD-CODE format)
+            pad_id: Pad ID (should already be lowercase from PADS table)
+
+        Returns:
+            True if optical and medical mosaics are complete, False otherwise
+
+        Raises:
+            ClientError: If DynamoDB or S3 fails during the check
+        """
+        cache_key = (site.lower(), sector.lower(), period, pad_id)
+        with self._completeness_lock:
+            if cache_key in self._complete_cache:
+                return True
+            if cache_key in self._incomplete_cache:
+                return False
+
+        is_complete = self._check_pad_completeness(site, sector, period, pad_id)
+
+        with self._completeness_lock:
+            if is_complete:
+                self._complete_cache[cache_key] = True
+            else:
+                self._incomplete_cache[cache_key] = False
+        return is_complete
+
+    def invalidate_pad(self, site: str, sector: str, period: str, pad_id: str) -> None:
+        """
+        Drop a pad's cached completeness and image records
+
+        Called when ingest publishes or replaces a pad's mosaics, so the next
+        request re-checks instead of waiting out the cache TTLs.
+
+        Args:
+            site: Site ID
+            sector: Sector ID
+            period: Period
+            pad_id: Pad ID
+        """
+        completeness_key = (site.lower(), sector.lower(), period, pad_id)
+        with self._completeness_lock:
+            self._complete_cache.pop(completeness_key, None)
+            self._incomplete_cache.pop(completeness_key, None)
+        with self._pad_images_lock:
+            self._pad_images_cache.pop((site, sector, period, pad_id), None)
+            self._pad_images_cache.pop(completeness_key, None)
+        logger.info("Invalidated cached completeness and images for %s", pad_id)
+
+    def _check_pad_completeness(
+        self,
+        site: str,
+        sector: str,
+        period: str,
+        pad_id: str
     ) -> bool:
         """
         Check if a pad has all required mosaics with complete files in S3
@@ -228,7 +628,8 @@ class MosaicService:
 
         Data format (from DynamoDB):
         - site_id: lowercase (e.g., "leyte")
-        - sector_period: "{sector}#{period}" (e.g., "malitbog#20250228-PMSB")
+        - sector_period_pad: "{sector}#{period}#{pad_id}"
+          (e.g., "malitbog#20250228-PMSB#leyte_malitbog_PAD_msb")
         - pad_id: lowercase with underscores (e.g., "leyte_malitbog_PAD_msb")
 
         Args:
@@ -248,104 +649,100 @@ class MosaicService:
         # pad_id should already be lowercase from PADS table
 
         try:
-            # Step 1: Query ONE image from this pad/period to check metadata
-            logger.info(f"Checking completeness for {pad_id} in {site}/{sector}/{period}")
-
-            response = self.images_table.query(
-                IndexName='SiteSectorPeriodIndex',
-                KeyConditionExpression='site_id = :site AND sector_period = :sp',
-                FilterExpression='pad_id = :pad',
-                ExpressionAttributeValues={
-                    ':site': site,                      # lowercase!
-                    ':sp': f"{sector}#{period}",       # lowercase sector!
-                    ':pad': pad_id
-                }
-                # NOTE: No Limit here! DynamoDB applies FilterExpression AFTER reading Limit items.
-                # Using Limit=1 would only check the first item in index order, missing other pads.
-                # We scan all items matching KeyCondition, apply filter, use first match for metadata.
-            )
+            # Step 1: Read this pad/period's images (shared with metadata)
+            logger.info("Checking completeness for %s in %s/%s/%s", pad_id, site, sector, period)
+
+            images = self._query_pad_images(site, sector, period, pad_id)
 
             # Step 2: Verify at least one image exists
-            if not response.get('Items'):
-                logger.warning(f"{pad_id}: No images found in DynamoDB")
+            if not images:
+                logger.warning("%s: No images found in DynamoDB", pad_id)
                 return False
 
-            first_image = response['Items'][0]
-            logger.info(f"{pad_id}: Found image {first_image.get('image_id')}")
+            first_image = images[0]
+            logger.debug("%s: Found image %s", pad_id, first_image.get('image_id'))
 
             # Step 3: Check metadata structure exists (null-safe)
             processing_status = first_image.get('processing_status')
             if not processing_status:
-                logger.warning(f"{pad_id}: processing_status is null")
+                logger.warning("%s: processing_status is null", pad_id)
                 return False
 
             mosaic_prep = processing_status.get('mosaic_prep')
             if not mosaic_prep:
-                logger.warning(f"{pad_id}: mosaic_prep is null")
+                logger.warning("%s: mosaic_prep is null", pad_id)
                 return False
 
             included_in = mosaic_prep.get('included_in', [])
             mosaic_s3_keys = mosaic_prep.get('mosaic_s3_keys', {})
 
-            logger.info(f"{pad_id}: included_in = {included_in}")
-            logger.info(f"{pad_id}: mosaic_s3_keys = {list(mosaic_s3_keys.keys())}")
+            logger.debug("%s: included_in = %s", pad_id, included_in)
+            logger.debug("%s: mosaic_s3_keys = %s", pad_id, list(mosaic_s3_keys))
 
             # Step 4: Verify both required types are present in metadata
             for mosaic_type in required_types:
                 if mosaic_type not in included_in:
-                    logger.warning(f"{pad_id}: Missing {mosaic_type} in included_in")
+                    logger.warning("%s: Missing %s in included_in", pad_id, mosaic_type)
                     return False
 
                 if mosaic_type not in mosaic_s3_keys:
-                    logger.warning(f"{pad_id}: Missing {mosaic_type} in mosaic_s3_keys")
+                    logger.warning("%s: Missing %s in mosaic_s3_keys", pad_id, mosaic_type)
                     return False
 
             # Step 5: Verify S3 files exist for both required types
+            base_keys = []
             for mosaic_type in required_types:
                 base_key = mosaic_s3_keys[mosaic_type]
 
                 # Validate base_key format (should not be empty/null)
                 if not base_key or not isinstance(base_key, str):
-                    logger.warning(f"{pad_id}: Invalid base_key for {mosaic_type}: {base_key}")
+                    logger.warning("%s: Invalid base_key for %s: %s", pad_id, mosaic_type, base_key)
                     return False
+                base_keys.append(base_key)
 
+            # One LIST per mosaic folder instead of a HEAD per file; the
+            # folders are listed concurrently
+            listed = _S3_CHECK_POOL.map(self._list_folder_keys, base_keys)
+            missing = []
+            for base_key, folder_keys in zip(base_keys, listed):
                 # Required files for viewer
-                required_files = [
-                    f"{base_key}/odm_orthophoto.tif",
-                    f"{base_key}/shots.geojson"
-                ]
+                for s3_key in (f"{base_key}/odm_orthophoto.tif", f"{base_key}/shots.geojson"):
+                    if s3_key not in folder_keys:
+                        missing.append(s3_key)
 
-                for s3_key in required_files:
-                    if not self._s3_object_exists(s3_key):
-                        logger.warning(f"{pad_id}: Missing S3 file {s3_key}")
-                        return False
+            if missing:
+                for s3_key in missing:
+                    logger.warning("%s: Missing S3 file %s", pad_id, s3_key)
+                return False
 
             # Step 6: Success!
-            logger.info(f"{pad_id}: COMPLETE ✓ (optical + medical verified)")
+            logger.info("%s: COMPLETE ✓ (optical + medical verified)", pad_id)
             return True
 
         except Exception as e:
-            logger.error(f"{pad_id}: Error checking completeness - {e}")
-            return False
+            # Not "incomplete": the caller must not cache or hide a failed check
+            logger.error("%s: Error checking completeness - %s", pad_id, e)
+            raise
 
-    def _s3_object_exists(self, s3_key: str) -> bool:
+    def _list_folder_keys(self, folder: str) -> Set[str]:
         """
-        Check if S3 object exists
+        List the objects directly inside an S3 "folder"
+
+        Delimiter='/' leaves out anything in subfolders (e.g. tiles), so a
+        mosaic's viewer folder is normally a single page.
 
         Args:
-            s3_key: S3 object key
+            folder: Key prefix without trailing slash
 
         Returns:
-            True if object exists, False otherwise
+            Set of object keys in the folder
+
+        Raises:
+            ClientError: If the listing fails (e.g. missing s3:ListBucket)
         """
-        try:
-            self.s3.head_object(Bucket=self.s3_bucket, Key=s3_key)
-            return True
-        except self.s3.exceptions.ClientError as e:
-            if e.response['Error']['Code'] == '404':
-                return False
-            # Re-raise other errors (permissions, etc.)
-            raise
-        except Exception as e:
-            logger.error(f"Error checking S3 object {s3_key}: {e}")
-            return False
+        keys = set()
+        paginator = self.s3.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.s3_bucket, Prefix=f"{folder}/", Delimiter='/'):
+            for obj in page.get('Contents', []):
+                keys.add(obj['Key'])
+        return keys
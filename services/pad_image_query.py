@@ -0,0 +1,147 @@
+"""
+Pad Image Query
+Reads one pad's image records, by pad key once the images table supports it
+"""
+
+import logging
+from typing import Dict, Iterator, Optional
+
+from botocore.exceptions import ClientError
+
+logger = logging.getLogger(__name__)
+
+# Key condition selecting one pad's images (:spp = sector#period#pad_id).
+# Needs sector_period_pad on every image item (scripts/backfill_sector_period_pad.py
+# for existing items, ingest for new ones)
+PAD_INDEX = 'SiteSectorPeriodPadIndex'
+PAD_KEY_CONDITION = 'site_id = :site AND sector_period_pad = :spp'
+
+# Default: read the pad's sector/period and filter on pad_id
+LEGACY_PAD_INDEX = 'SiteSectorPeriodIndex'
+LEGACY_PAD_KEY_CONDITION = 'site_id = :site AND sector_period = :sp'
+LEGACY_PAD_FILTER = 'pad_id = :pad'
+
+# DynamoDB answers a query on a missing index with ValidationException ("The
+# table does not have the specified index"); DynamoDB Local and moto use
+# ResourceNotFoundException ("Invalid index")
+MISSING_INDEX_ERRORS = ('ValidationException', 'ResourceNotFoundException')
+_MISSING_INDEX_MESSAGES = ('specified index', 'invalid index')
+
+
+def is_missing_index_error(error: ClientError) -> bool:
+    """True if a query failed because the requested index doesn't exist"""
+    details = error.response.get('Error', {})
+    message = details.get('Message', '').lower()
+    return (
+        details.get('Code') in MISSING_INDEX_ERRORS
+        and any(text in message for text in _MISSING_INDEX_MESSAGES)
+    )
+
+
+class PadImageQuery:
+    """
+    Low-level DynamoDB query for one pad's images
+
+    By default a pad is read from SiteSectorPeriodIndex with a pad_id filter.
+    With use_pad_index (only once every image item carries sector_period_pad)
+    it is read by key from SiteSectorPeriodPadIndex instead, so only the pad's
+    images are read. If that index turns out to be missing, the filtered
+    query is used until restart.
+    """
+
+    def __init__(self, dynamodb_client, table_name: str, use_pad_index: bool = False):
+        """
+        Initialize Pad Image Query
+
+        Args:
+            dynamodb_client: Low-level DynamoDB (or DAX) client
+            table_name: Images table name
+            use_pad_index: Query SiteSectorPeriodPadIndex. A pad whose items
+                lack sector_period_pad would be read incompletely, so enable
+                this only after the backfill, with ingest writing the attribute.
+        """
+        self.dynamodb_client = dynamodb_client
+        self.table_name = table_name
+        self.use_pad_index = use_pad_index
+
+    def pages(self, site: str, sector: str, period: str, pad_id: str, **query_kwargs) -> Iterator[Dict]:
+        """
+        Yield the raw query response pages for a pad's images
+
+        Args:
+            site: Site ID
+            sector: Sector ID
+            period: Period
+            pad_id: Pad ID
+            **query_kwargs: Extra query arguments (ProjectionExpression,
+                Select, Limit); Limit is dropped on the filtered query, where
+                the filter is applied after it
+
+        Yields:
+            Query responses with raw (DynamoDB JSON) Items and Count
+        """
+        if self.use_pad_index:
+            pad_kwargs = dict(
+                query_kwargs,
+                TableName=self.table_name,
+                IndexName=PAD_INDEX,
+                KeyConditionExpression=PAD_KEY_CONDITION,
+                ExpressionAttributeValues={
+                    ':site': {'S': site},
+                    ':spp': {'S': f"{sector}#{period}#{pad_id}"}
+                }
+            )
+            try:
+                response = self.dynamodb_client.query(**pad_kwargs)
+            except ClientError as e:
+                if not is_missing_index_error(e):
+                    raise
+                logger.warning("%s unavailable, falling back to %s: %s", PAD_INDEX, LEGACY_PAD_INDEX, e)
+                self.use_pad_index = False
+            else:
+                yield from self._paginate(response, pad_kwargs)
+                return
+
+        legacy_kwargs = dict(
+            query_kwargs,
+            TableName=self.table_name,
+            IndexName=LEGACY_PAD_INDEX,
+            KeyConditionExpression=LEGACY_PAD_KEY_CONDITION,
+            FilterExpression=LEGACY_PAD_FILTER,
+            ExpressionAttributeValues={
+                ':site': {'S': site},
+                ':sp': {'S': f"{sector}#{period}"},
+                ':pad': {'S': pad_id}
+            }
+        )
+        legacy_kwargs.pop('Limit', None)
+        yield from self._paginate(self.dynamodb_client.query(**legacy_kwargs), legacy_kwargs)
+
+    def first_item(self, site: str, sector: str, period: str, pad_id: str, **query_kwargs) -> Optional[Dict]:
+        """
+        Read one of a pad's images
+
+        Args:
+            site: Site ID
+            sector: Sector ID
+            period: Period
+            pad_id: Pad ID
+            **query_kwargs: Extra query arguments (e.g. ProjectionExpression)
+
+        Returns:
+            Raw item, or None if the pad has no images
+        """
+        for page in self.pages(site, sector, period, pad_id, Limit=1, **query_kwargs):
+            items = page.get('Items')
+            if items:
+                return items[0]
+        return None
+
+    def _paginate(self, response: Dict, query_kwargs: Dict) -> Iterator[Dict]:
+        # Pages chain through LastEvaluatedKey (looped by hand rather than with
+        # a paginator, which the DAX client doesn't provide)
+        yield response
+        while 'LastEvaluatedKey' in response:
+            query_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+            response = self.dynamodb_client.query(**query_kwargs)
+            yield response
@@ -10,6 +10,16 @@ from typing import Optional, Dict, Any, List
 
 logger = logging.getLogger(__name__)
 
+# Key conditions on SiteSectorPeriodPadIndex: one pad (:spp = sector#period#pad_id)
+# or every pad in a sector and period (:prefix = sector#period#)
+MEASUREMENT_INDEX = 'SiteSectorPeriodPadIndex'
+PAD_KEY_CONDITION = 'site_id = :site AND sector_period_pad = :spp'
+SECTOR_KEY_CONDITION = 'site_id = :site AND begins_with(sector_period_pad, :prefix)'
+
+# Attributes returned by sector queries in summary mode; per-region details
+# (region_measurements) are what make full items large
+SUMMARY_PROJECTION = 'measurement_id, pad_id, aggregate_stats, geo_bounds'
+
 
 class PipeMeasureService:
     """
@@ -25,6 +35,7 @@ class PipeMeasureService:
 
         Args:
             measurements_table: boto3 DynamoDB Table resource for measurements
+                (or the equivalent amazondax Table, which caches the reads)
         """
         self.measurements_table = measurements_table
         logger.info("PipeMeasureService initialized")
@@ -71,8 +82,8 @@ class PipeMeasureService:
 
             # Query using the GSI
             response = self.measurements_table.query(
-                IndexName='SiteSectorPeriodPadIndex',
-                KeyConditionExpression='site_id = :site AND sector_period_pad = :spp',
+                IndexName=MEASUREMENT_INDEX,
+                KeyConditionExpression=PAD_KEY_CONDITION,
                 ExpressionAttributeValues={
                     ':site': site,
                     ':spp': sector_period_pad
@@ -149,7 +160,8 @@ class PipeMeasureService:
         self,
         site: str,
         sector: str,
-        period: str
+        period: str,
+        summary: bool = False
     ) -> List[Dict[str, Any]]:
         """
         Get all pipe measurements for a sector/period.
@@ -157,10 +169,15 @@ class PipeMeasureService:
         Queries the measurements table using the SiteSectorPeriodPadIndex GSI
         with begins_with to retrieve all pad measurements for a given sector/period.
 
+        Query pages chain through LastEvaluatedKey, so they can't be fetched
+        in parallel; summary mode instead cuts the number of 1 MB pages by
+        leaving out per-region details.
+
         Args:
             site: Site identifier (e.g., "leyte")
             sector: Sector identifier (e.g., "malitbog")
             period: Period identifier (e.g., "20250228-PMSB")
+            summary: Return only SUMMARY_PROJECTION attributes
 
         Returns:
             List of measurement dictionaries for all pads in the sector/period.
@@ -183,28 +200,24 @@ class PipeMeasureService:
             )
 
             # Query using the GSI with begins_with on sort key
-            response = self.measurements_table.query(
-                IndexName='SiteSectorPeriodPadIndex',
-                KeyConditionExpression='site_id = :site AND begins_with(sector_period_pad, :prefix)',
-                ExpressionAttributeValues={
+            query_kwargs = {
+                'IndexName': MEASUREMENT_INDEX,
+                'KeyConditionExpression': SECTOR_KEY_CONDITION,
+                'ExpressionAttributeValues': {
                     ':site': site,
                     ':prefix': sector_period_prefix
                 }
-            )
+            }
+            if summary:
+                query_kwargs['ProjectionExpression'] = SUMMARY_PROJECTION
 
+            response = self.measurements_table.query(**query_kwargs)
             items = response.get('Items', [])
 
             # Handle pagination if there are more results
             while 'LastEvaluatedKey' in response:
-                response = self.measurements_table.query(
-                    IndexName='SiteSectorPeriodPadIndex',
-                    KeyConditionExpression='site_id = :site AND begins_with(sector_period_pad, :prefix)',
-                    ExpressionAttributeValues={
-                        ':site': site,
-                        ':prefix': sector_period_prefix
-                    },
-                    ExclusiveStartKey=response['LastEvaluatedKey']
-                )
+                query_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+                response = self.measurements_table.query(**query_kwargs)
                 items.extend(response.get('Items', []))
 
             logger.info(
@@ -2,42 +2,119 @@
 ReportService - Generates Line Loss Analytics PDF reports
 
 Uses docxtpl to fill Word templates and LibreOffice to convert to PDF.
+Conversions go to a persistent LibreOffice listener (unoserver) when one is
+configured, avoiding a LibreOffice cold start per report. Alternatively the
+PDF can be drawn directly with ReportLab (no template, no LibreOffice).
 """
 
+import datetime
+import io
 import os
+import shutil
+import socket
 import subprocess
 import tempfile
+import threading
 import logging
+from typing import Optional
+from xml.sax.saxutils import escape
 from docxtpl import DocxTemplate
+from unoserver.client import UnoClient
 
 logger = logging.getLogger(__name__)
 
+# PDF renderers: the Word template via LibreOffice, or ReportLab directly
+RENDERER_DOCX = 'docx'
+RENDERER_REPORTLAB = 'reportlab'
+
+# Bill of quantities columns, as in the Word template
+REPORT_TABLE_HEADER = ['LOCATION', 'LENGTH (m)', 'DESCRIPTION', 'QTY', 'UNIT COST', 'TOTAL COST']
+
 
 class ReportService:
     """
     Service for generating PDF reports from Word templates.
     """
 
-    def __init__(self, template_path: str):
+    def __init__(
+        self,
+        template_path: str,
+        unoserver_host: Optional[str] = None,
+        unoserver_port: int = 2003,
+        max_concurrent_conversions: int = 2,
+        renderer: str = RENDERER_DOCX
+    ):
         """
         Initialize the ReportService.
 
         Args:
             template_path: Path to the Word template file (.docx)
+            unoserver_host: Host of a running unoserver listener; None to spawn
+                LibreOffice for every conversion
+            unoserver_port: Port of the unoserver XML-RPC listener
+            max_concurrent_conversions: Conversions allowed in flight on the listener
+            renderer: 'docx' to fill the Word template and convert it with
+                LibreOffice, or 'reportlab' to draw the PDF directly (tens of
+                milliseconds, but without the template's branding and fonts)
         """
+        if renderer not in (RENDERER_DOCX, RENDERER_REPORTLAB):
+            raise ValueError(f"Unknown report renderer: {renderer}")
         self.template_path = template_path
+        self.unoserver_host = unoserver_host
+        self.unoserver_port = unoserver_port
+        self.renderer = renderer
+        # One LibreOffice instance renders documents serially; bound the queue on it
+        self._conversion_slots = threading.BoundedSemaphore(max_concurrent_conversions)
+        # Template file contents and the mtime they were read at
+        self._template_bytes: Optional[bytes] = None
+        self._template_mtime: Optional[float] = None
+        self._template_lock = threading.Lock()
+
         if not os.path.exists(template_path):
             logger.warning(f"Template file not found: {template_path}")
         else:
             logger.info(f"ReportService initialized with template: {template_path}")
 
+        if renderer == RENDERER_REPORTLAB:
+            logger.info("PDF reports drawn with ReportLab")
+        elif unoserver_host:
+            logger.info(f"PDF conversion via unoserver at {unoserver_host}:{unoserver_port}")
+
+    def _load_template(self) -> DocxTemplate:
+        """
+        Get a fresh DocxTemplate for the Word template.
+
+        The file is read once and kept in memory; a stat per call picks up a
+        replaced template. render() modifies the document, so every call
+        still parses its own copy.
+
+        Returns:
+            Unrendered DocxTemplate
+
+        Raises:
+            FileNotFoundError: If template file doesn't exist
+        """
+        try:
+            mtime = os.stat(self.template_path).st_mtime
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Template file not found: {self.template_path}")
+
+        with self._template_lock:
+            if self._template_bytes is None or mtime != self._template_mtime:
+                logger.info(f"Loading template from: {self.template_path}")
+                with open(self.template_path, 'rb') as f:
+                    self._template_bytes = f.read()
+                self._template_mtime = mtime
+            template_bytes = self._template_bytes
+
+        return DocxTemplate(io.BytesIO(template_bytes))
+
     def generate_pdf(self, report_data: dict) -> bytes:
         """
-        Generate PDF report from data.
+        Generate PDF report from data and return it as bytes.
 
-        1. Fill Word template with data using docxtpl
-        2. Convert to PDF using LibreOffice headless mode
-        3. Return PDF bytes
+        Prefer generate_pdf_to() when the PDF is going straight to a response;
+        this reads the whole document into memory.
 
         Args:
             report_data: Dictionary containing:
@@ -52,13 +129,43 @@ class ReportService:
             FileNotFoundError: If template file doesn't exist
             Exception: If LibreOffice conversion fails
         """
-        if not os.path.exists(self.template_path):
-            raise FileNotFoundError(f"Template file not found: {self.template_path}")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pdf_path = os.path.join(temp_dir, 'report.pdf')
+            self.generate_pdf_to(pdf_path, report_data)
+            with open(pdf_path, 'rb') as f:
+                return f.read()
+
+    def generate_pdf_to(self, pdf_path: str, report_data: dict) -> None:
+        """
+        Generate PDF report from data and write it to pdf_path.
+
+        1. Fill Word template with data using docxtpl
+        2. Convert to PDF using LibreOffice headless mode
+        3. Leave the PDF at pdf_path for the caller to stream and clean up
+
+        With the ReportLab renderer the PDF is drawn straight to pdf_path instead.
+
+        Args:
+            pdf_path: Destination path for the PDF (overwritten if it exists)
+            report_data: Dictionary containing:
+                - site: Site name (string)
+                - sector: Sector name (string)
+                - rows: List of dicts with 'section' and 'length' keys
+
+        Raises:
+            FileNotFoundError: If template file doesn't exist
+            Exception: If LibreOffice conversion fails
+        """
+        if self.renderer == RENDERER_REPORTLAB:
+            self._build_pdf(pdf_path, report_data)
+            logger.info(f"PDF drawn successfully ({os.path.getsize(pdf_path)} bytes)")
+            return
+
+        # Raises FileNotFoundError before any temp files are created
+        doc = self._load_template()
 
         with tempfile.TemporaryDirectory() as temp_dir:
-            # 1. Load and fill template
-            logger.info(f"Loading template from: {self.template_path}")
-            doc = DocxTemplate(self.template_path)
+            # 1. Fill template
             doc.render(report_data)
 
             # 2. Save filled docx to temp directory
@@ -67,33 +174,134 @@ class ReportService:
             logger.info(f"Filled template saved to: {filled_path}")
 
             # 3. Convert to PDF using LibreOffice
-            logger.info("Converting to PDF using LibreOffice...")
-            result = subprocess.run(
-                [
-                    'libreoffice',
-                    '--headless',
-                    '--convert-to', 'pdf',
-                    '--outdir', temp_dir,
-                    filled_path
-                ],
-                capture_output=True,
-                timeout=60
-            )
-
-            if result.returncode != 0:
-                error_msg = result.stderr.decode() if result.stderr else 'Unknown error'
-                logger.error(f"LibreOffice conversion failed: {error_msg}")
-                raise Exception(f"PDF conversion failed: {error_msg}")
-
-            # 4. Read and return PDF
-            pdf_path = os.path.join(temp_dir, 'report.pdf')
-            if not os.path.exists(pdf_path):
-                raise Exception("PDF file was not created by LibreOffice")
+            self._convert_to_pdf(filled_path, pdf_path)
 
-            with open(pdf_path, 'rb') as f:
-                pdf_bytes = f.read()
-                logger.info(f"PDF generated successfully ({len(pdf_bytes)} bytes)")
-                return pdf_bytes
+        if not os.path.exists(pdf_path) or os.path.getsize(pdf_path) == 0:
+            raise Exception("PDF file was not created by LibreOffice")
+
+        logger.info(f"PDF generated successfully ({os.path.getsize(pdf_path)} bytes)")
+
+    def _build_pdf(self, pdf_path: str, report_data: dict) -> None:
+        """
+        Draw the report with ReportLab, following the Word template's layout.
+
+        Args:
+            pdf_path: Destination path for the PDF
+            report_data: Same fields as generate_pdf_to(); 'date' and 'period'
+                are optional (date defaults to today)
+        """
+        # Imported here so the docx renderer doesn't load ReportLab
+        from reportlab.lib import colors
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.styles import getSampleStyleSheet
+        from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+        styles = getSampleStyleSheet()
+        body = styles['Normal']
+
+        def text(value) -> str:
+            return escape(str(value)) if value is not None else ''
+
+        date = report_data.get('date') or datetime.date.today().isoformat()
+        story = [
+            Paragraph(f"Date extracted: {text(date)}", body),
+            Paragraph(f"Reference: {text(report_data.get('period'))} Drone-Thermal Survey dataset", body),
+            Paragraph(f"Site: {text(report_data['site'])}", body),
+            Paragraph(f"Sector: {text(report_data['sector'])}", body),
+            Spacer(1, 12),
+            Paragraph("ANALYTICS RESULT (generated from Dashboard)", styles['Heading2']),
+            Paragraph("FIELD SCOPING AND BILL OF QUANTITIES "
+                      "(to be provided by Site Reliability and Maintenance teams)", body),
+            Spacer(1, 6),
+        ]
+
+        table_rows = [REPORT_TABLE_HEADER] + [
+            [text(row.get('section')), text(row.get('length')), '', '', '', '']
+            for row in report_data['rows']
+        ]
+        table = Table(table_rows, repeatRows=1)
+        table.setStyle(TableStyle([
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+            ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('ALIGN', (1, 1), (1, -1), 'RIGHT'),
+        ]))
+        story.append(table)
+
+        SimpleDocTemplate(pdf_path, pagesize=A4, title=f"Line Loss Report - {report_data['sector']}").build(story)
+
+    def _convert_to_pdf(self, docx_path: str, pdf_path: str) -> None:
+        """
+        Convert a .docx file to PDF.
+
+        Uses the persistent unoserver listener when it is reachable, otherwise
+        (or if the listener fails mid-conversion) falls back to a one-shot
+        headless LibreOffice process.
+
+        Args:
+            docx_path: Path of the filled Word document
+            pdf_path: Path to write the PDF to
+
+        Raises:
+            Exception: If conversion fails
+        """
+        if self._unoserver_available():
+            logger.info("Converting to PDF using unoserver...")
+            try:
+                with self._conversion_slots:
+                    UnoClient(
+                        server=self.unoserver_host,
+                        port=str(self.unoserver_port)
+                    ).convert(inpath=docx_path, outpath=pdf_path, convert_to='pdf')
+                return
+            except Exception as e:
+                # The listener exits on a timed-out conversion and is restarted
+                # by the entrypoint; don't fail the report meanwhile
+                logger.warning(f"unoserver conversion failed, retrying with LibreOffice: {e}")
+
+        logger.info("Converting to PDF using LibreOffice...")
+        out_dir = os.path.dirname(docx_path)
+        result = subprocess.run(
+            [
+                'libreoffice',
+                '--headless',
+                '--convert-to', 'pdf',
+                '--outdir', out_dir,
+                docx_path
+            ],
+            capture_output=True,
+            timeout=60
+        )
+
+        if result.returncode != 0:
+            error_msg = result.stderr.decode() if result.stderr else 'Unknown error'
+            logger.error(f"LibreOffice conversion failed: {error_msg}")
+            raise Exception(f"PDF conversion failed: {error_msg}")
+
+        # --convert-to names the output after the input; move it where the caller asked
+        converted = os.path.join(out_dir, os.path.splitext(os.path.basename(docx_path))[0] + '.pdf')
+        if os.path.exists(converted) and converted != pdf_path:
+            shutil.move(converted, pdf_path)
+
+    def _unoserver_available(self) -> bool:
+        """
+        Check that the unoserver listener accepts connections.
+
+        UnoClient retries unreachable servers for tens of seconds, so probe the
+        port first and fall back to a one-shot conversion straight away.
+
+        Returns:
+            True if a listener is configured and reachable, False otherwise
+        """
+        if not self.unoserver_host:
+            return False
+        try:
+            with socket.create_connection((self.unoserver_host, self.unoserver_port), timeout=1):
+                return True
+        except OSError as e:
+            logger.warning(f"unoserver unreachable at {self.unoserver_host}:{self.unoserver_port}: {e}")
+            return False
 
     def generate_docx(self, report_data: dict) -> bytes:
         """
@@ -107,16 +315,10 @@ class ReportService:
         Returns:
             DOCX file as bytes
         """
-        if not os.path.exists(self.template_path):
-            raise FileNotFoundError(f"Template file not found: {self.template_path}")
-
-        doc = DocxTemplate(self.template_path)
+        doc = self._load_template()
         doc.render(report_data)
 
-        with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as tmp:
-            doc.save(tmp.name)
-            tmp.seek(0)
-            with open(tmp.name, 'rb') as f:
-                docx_bytes = f.read()
-            os.unlink(tmp.name)
-            return docx_bytes
+        # DocxTemplate.save accepts a file-like object; no temp file needed
+        buffer = io.BytesIO()
+        doc.save(buffer)
+        return buffer.getvalue()
@@ -0,0 +1,24 @@
+"""
+Shared test fixtures
+
+AWS is mocked with moto; nothing here touches a real account.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+REGION = 'ap-southeast-1'
+
+
+@pytest.fixture
+def aws_env(monkeypatch):
+    """Fake credentials and region so boto3 never reaches a real account"""
+    monkeypatch.setenv('AWS_ACCESS_KEY_ID', 'testing')
+    monkeypatch.setenv('AWS_SECRET_ACCESS_KEY', 'testing')
+    monkeypatch.delenv('AWS_SESSION_TOKEN', raising=False)
+    monkeypatch.setenv('AWS_DEFAULT_REGION', REGION)
+    monkeypatch.setenv('AWS_REGION', REGION)
@@ -0,0 +1,157 @@
+"""
+/api/sites and /api/sectors: AllPadsIndex query with scan fallback
+"""
+
+import importlib
+
+import boto3
+import pytest
+from botocore.exceptions import ClientError
+from moto import mock_aws
+
+REGION = 'ap-southeast-1'
+
+PADS = [
+    ('leyte', 'tongonan', '401'),
+    ('leyte', 'mahanagdong-a', 'a1'),
+    ('leytex', 'foo', 'f1'),
+    ('negros', 'palinpinon', 'p1'),
+]
+
+
+@pytest.fixture(scope='module')
+def app_module():
+    with pytest.MonkeyPatch.context() as monkeypatch, mock_aws():
+        for name, value in {
+            'AWS_ACCESS_KEY_ID': 'testing',
+            'AWS_SECRET_ACCESS_KEY': 'testing',
+            'AWS_DEFAULT_REGION': REGION,
+            'AWS_REGION': REGION,
+            'S3_BUCKET': 'thermal-test-bucket',
+            'PADS_TABLE': 'pads',
+            'IMAGES_TABLE': 'images',
+            'JOBS_TABLE': 'jobs',
+            'MEASUREMENTS_TABLE': 'measurements',
+        }.items():
+            monkeypatch.setenv(name, value)
+        for name in ('AWS_SESSION_TOKEN', 'COGNITO_USER_POOL_ID', 'DAX_ENDPOINT', 'COLORBAR_BLOOM_KEY', 'CLOUDFRONT_DOMAIN'):
+            monkeypatch.delenv(name, raising=False)
+
+        yield importlib.import_module('app')
+
+
+@pytest.fixture
+def pads_table(app_module):
+    """Factory creating the pads table (with or without AllPadsIndex) for one test"""
+    created = []
+
+    def create(with_index=True, entity_type=True):
+        attributes = [{'AttributeName': 'pad_id', 'AttributeType': 'S'}]
+        kwargs = {}
+        if with_index:
+            attributes += [
+                {'AttributeName': 'entity_type', 'AttributeType': 'S'},
+                {'AttributeName': 'site_sector', 'AttributeType': 'S'}
+            ]
+            kwargs['GlobalSecondaryIndexes'] = [{
+                'IndexName': app_module.ALL_PADS_INDEX,
+                'KeySchema': [
+                    {'AttributeName': 'entity_type', 'KeyType': 'HASH'},
+                    {'AttributeName': 'site_sector', 'KeyType': 'RANGE'}
+                ],
+                'Projection': {'ProjectionType': 'INCLUDE', 'NonKeyAttributes': ['site', 'sector']}
+            }]
+        table = boto3.resource('dynamodb', region_name=REGION).create_table(
+            TableName='pads',
+            KeySchema=[{'AttributeName': 'pad_id', 'KeyType': 'HASH'}],
+            AttributeDefinitions=attributes,
+            BillingMode='PAY_PER_REQUEST',
+            **kwargs
+        )
+        for site, sector, pad in PADS:
+            item = {'pad_id': f"{site}_{sector}_PAD_{pad}", 'site': site, 'sector': sector}
+            if entity_type:
+                item.update(entity_type='pad', site_sector=f"{site}_{sector}")
+            table.put_item(Item=item)
+        created.append(table)
+        return table
+
+    app_module.cache.clear()
+    yield create
+    for table in created:
+        table.delete()
+
+
+@pytest.fixture
+def client(app_module):
+    return app_module.app.test_client()
+
+
+@pytest.fixture
+def scans(app_module, monkeypatch):
+    """Record the attributes each fallback scan collects"""
+    calls = []
+    parallel_scan = app_module._parallel_scan
+
+    def recording_scan(table_name, attribute, **scan_kwargs):
+        calls.append(attribute)
+        return parallel_scan(table_name, attribute, **scan_kwargs)
+
+    monkeypatch.setattr(app_module, '_parallel_scan', recording_scan)
+    return calls
+
+
+def test_sites_from_index(pads_table, client, scans):
+    pads_table()
+
+    response = client.get('/api/sites')
+
+    assert response.status_code == 200
+    assert response.get_json() == ['leyte', 'leytex', 'negros']
+    assert scans == []
+
+
+def test_sectors_from_index_exclude_prefixed_sites(pads_table, client, scans):
+    pads_table()
+
+    response = client.get('/api/sectors?site=leyte')
+
+    assert response.get_json() == ['mahanagdong-a', 'tongonan']
+    assert scans == []
+
+
+@pytest.mark.parametrize('with_index, entity_type', [(False, False), (True, False)])
+def test_sites_fall_back_to_scan(pads_table, client, scans, with_index, entity_type):
+    # Index missing, or present but empty because pads lack entity_type
+    pads_table(with_index=with_index, entity_type=entity_type)
+
+    response = client.get('/api/sites')
+
+    assert response.status_code == 200
+    assert response.get_json() == ['leyte', 'leytex', 'negros']
+    assert scans == ['site']
+
+
+@pytest.mark.parametrize('with_index, entity_type', [(False, False), (True, False)])
+def test_sectors_fall_back_to_scan(pads_table, client, scans, with_index, entity_type):
+    pads_table(with_index=with_index, entity_type=entity_type)
+
+    response = client.get('/api/sectors?site=leyte')
+
+    assert response.status_code == 200
+    assert response.get_json() == ['mahanagdong-a', 'tongonan']
+    assert scans == ['sector']
+
+
+def test_other_query_errors_are_not_masked_by_a_scan(app_module, pads_table, client, scans, monkeypatch):
+    pads_table()
+
+    def invalid_query(*args, **kwargs):
+        raise ClientError({'Error': {'Code': 'ValidationException', 'Message': 'Invalid KeyConditionExpression'}}, 'Query')
+
+    monkeypatch.setattr(app_module, '_query_unique', invalid_query)
+
+    response = client.get('/api/sites')
+
+    assert response.status_code == 500
+    assert scans == []
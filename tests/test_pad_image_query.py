@@ -0,0 +1,160 @@
+"""
+PadImageQuery against a moto images table
+"""
+
+import boto3
+import pytest
+from botocore.exceptions import ClientError
+from botocore.stub import Stubber
+from moto import mock_aws
+
+from services.pad_image_query import PAD_INDEX, PadImageQuery, is_missing_index_error
+
+REGION = 'ap-southeast-1'
+TABLE = 'images'
+SECTOR = 'tongonan'
+PERIOD = '20250409'
+PAD = 'leyte_tongonan_PAD_401'
+OTHER_PAD = 'leyte_tongonan_PAD_402'
+
+
+def _create_images_table(with_pad_index=True):
+    def string_attribute(name):
+        return {'AttributeName': name, 'AttributeType': 'S'}
+
+    def index(name, sort_key):
+        return {
+            'IndexName': name,
+            'KeySchema': [
+                {'AttributeName': 'site_id', 'KeyType': 'HASH'},
+                {'AttributeName': sort_key, 'KeyType': 'RANGE'}
+            ],
+            'Projection': {'ProjectionType': 'ALL'}
+        }
+
+    attributes = [string_attribute('image_id'), string_attribute('site_id'), string_attribute('sector_period')]
+    indexes = [index('SiteSectorPeriodIndex', 'sector_period')]
+    if with_pad_index:
+        attributes.append(string_attribute('sector_period_pad'))
+        indexes.append(index(PAD_INDEX, 'sector_period_pad'))
+
+    return boto3.resource('dynamodb', region_name=REGION).create_table(
+        TableName=TABLE,
+        KeySchema=[{'AttributeName': 'image_id', 'KeyType': 'HASH'}],
+        AttributeDefinitions=attributes,
+        GlobalSecondaryIndexes=indexes,
+        BillingMode='PAY_PER_REQUEST'
+    )
+
+
+def _put_images(table, pad_id, count, backfilled):
+    """Write count images for a pad; only the first backfilled carry sector_period_pad"""
+    for i in range(count):
+        item = {
+            'image_id': f"{pad_id}_{i}",
+            'site_id': 'leyte',
+            'sector_period': f"{SECTOR}#{PERIOD}",
+            'pad_id': pad_id
+        }
+        if i < backfilled:
+            item['sector_period_pad'] = f"{SECTOR}#{PERIOD}#{pad_id}"
+        table.put_item(Item=item)
+
+
+def _image_ids(query, pad_id=PAD):
+    return sorted(
+        item['image_id']['S']
+        for page in query.pages('leyte', SECTOR, PERIOD, pad_id)
+        for item in page['Items']
+    )
+
+
+@pytest.fixture
+def dynamodb(aws_env):
+    with mock_aws():
+        yield boto3.client('dynamodb', region_name=REGION)
+
+
+def test_reads_every_image_of_a_partially_backfilled_pad_by_default(dynamodb):
+    table = _create_images_table()
+    _put_images(table, PAD, 5, backfilled=3)
+    _put_images(table, OTHER_PAD, 2, backfilled=2)
+
+    query = PadImageQuery(dynamodb, TABLE)
+
+    assert _image_ids(query) == [f"{PAD}_{i}" for i in range(5)]
+
+
+def test_count_covers_a_partially_backfilled_pad_by_default(dynamodb):
+    table = _create_images_table()
+    _put_images(table, PAD, 5, backfilled=3)
+
+    query = PadImageQuery(dynamodb, TABLE)
+
+    assert sum(page['Count'] for page in query.pages('leyte', SECTOR, PERIOD, PAD, Select='COUNT')) == 5
+
+
+def test_pad_index_reads_only_the_pad(dynamodb):
+    table = _create_images_table()
+    _put_images(table, PAD, 3, backfilled=3)
+    _put_images(table, OTHER_PAD, 2, backfilled=2)
+
+    query = PadImageQuery(dynamodb, TABLE, use_pad_index=True)
+    pages = list(query.pages('leyte', SECTOR, PERIOD, PAD))
+
+    assert sorted(item['image_id']['S'] for page in pages for item in page['Items']) == [
+        f"{PAD}_{i}" for i in range(3)
+    ]
+    # Read by key: nothing scanned beyond the pad's own items
+    assert sum(page['ScannedCount'] for page in pages) == 3
+    assert query.use_pad_index
+
+
+def test_first_item_with_pad_index(dynamodb):
+    table = _create_images_table()
+    _put_images(table, PAD, 3, backfilled=3)
+
+    query = PadImageQuery(dynamodb, TABLE, use_pad_index=True)
+
+    assert query.first_item('leyte', SECTOR, PERIOD, PAD)['pad_id']['S'] == PAD
+    assert query.first_item('leyte', SECTOR, PERIOD, 'missing_pad') is None
+
+
+def test_missing_pad_index_falls_back_to_the_filtered_query(dynamodb):
+    table = _create_images_table(with_pad_index=False)
+    _put_images(table, PAD, 4, backfilled=0)
+    _put_images(table, OTHER_PAD, 2, backfilled=0)
+
+    query = PadImageQuery(dynamodb, TABLE, use_pad_index=True)
+
+    assert _image_ids(query) == [f"{PAD}_{i}" for i in range(4)]
+    assert not query.use_pad_index
+
+
+def test_other_validation_errors_are_raised(aws_env):
+    client = boto3.client('dynamodb', region_name=REGION)
+    query = PadImageQuery(client, TABLE, use_pad_index=True)
+
+    with Stubber(client) as stubber:
+        stubber.add_client_error(
+            'query',
+            service_error_code='ValidationException',
+            service_message='Query condition missed key schema element: sector_period_pad'
+        )
+        with pytest.raises(ClientError):
+            list(query.pages('leyte', SECTOR, PERIOD, PAD))
+
+    assert query.use_pad_index
+
+
+@pytest.mark.parametrize('code, message, expected', [
+    ('ValidationException', 'The table does not have the specified index: SiteSectorPeriodPadIndex', True),
+    ('ResourceNotFoundException', 'Invalid index: SiteSectorPeriodPadIndex for table: images', True),
+    ('ValidationException', 'Query condition missed key schema element: site_id', False),
+    ('ResourceNotFoundException', 'Requested resource not found', False),
+    ('ProvisionedThroughputExceededException', 'Rate exceeded', False),
+])
+def test_is_missing_index_error(code, message, expected):
+    error = ClientError({'Error': {'Code': code, 'Message': message}}, 'Query')
+
+    assert is_missing_index_error(error) is expected
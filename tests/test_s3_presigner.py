@@ -0,0 +1,61 @@
+"""
+S3Presigner must produce the same URL as botocore's generate_presigned_url
+"""
+
+import datetime
+from unittest import mock
+
+import boto3
+import pytest
+from botocore.config import Config
+from botocore.credentials import Credentials
+
+from services.s3_presigner import S3Presigner
+
+REGION = 'ap-southeast-1'
+BUCKET = 'thermal-test-bucket'
+# On the hour, so the presigner's hour-floored X-Amz-Date equals botocore's
+NOW = datetime.datetime(2025, 4, 9, 10, 0, 0)
+
+KEYS = [
+    'mosaics/leyte/tongonan/20250409/leyte_tongonan_PAD_401/optical/viewer/odm_orthophoto.tif',
+    'optical/DJI 0001_W.JPG',
+    'colored/medical/a+b=c&d/ñandú~(1).png',
+]
+
+
+def _botocore_url(credentials, key, **params):
+    client = boto3.client(
+        's3',
+        region_name=REGION,
+        aws_access_key_id=credentials.access_key,
+        aws_secret_access_key=credentials.secret_key,
+        aws_session_token=credentials.token,
+        config=Config(signature_version='s3v4', s3={'addressing_style': 'virtual'})
+    )
+    with mock.patch('botocore.auth.get_current_datetime', return_value=NOW):
+        return client.generate_presigned_url(
+            'get_object', Params={'Bucket': BUCKET, 'Key': key, **params}, ExpiresIn=3600
+        )
+
+
+@pytest.mark.parametrize('key', KEYS)
+@pytest.mark.parametrize('token', [None, 'FwoGZXIvYXdzEB8aDH+session/token=='])
+def test_matches_botocore(key, token):
+    credentials = Credentials('AKIDEXAMPLE', 'wJalrXUtnFEMI/K7MDENG/bPxRfiCYEXAMPLEKEY', token)
+    presigner = S3Presigner(credentials, BUCKET, REGION)
+
+    assert presigner.presign_get(key, 3600, now=NOW) == _botocore_url(credentials, key)
+
+
+@pytest.mark.parametrize('key', KEYS)
+def test_matches_botocore_with_cache_control(key):
+    credentials = Credentials('AKIDEXAMPLE', 'wJalrXUtnFEMI/K7MDENG/bPxRfiCYEXAMPLEKEY', 'token')
+    presigner = S3Presigner(credentials, BUCKET, REGION)
+    cache_control = 'public, max-age=3600'
+
+    assert (
+        presigner.presign_get(key, 3600, now=NOW, response_cache_control=cache_control)
+        == _botocore_url(credentials, key, ResponseCacheControl=cache_control)
+    )
+